@@ -2,7 +2,7 @@ import uuid
 from typing import Any
 
 from .config import add_account as config_add_account
-from .db import get_db
+from .db import get_db, prefix_bounds
 
 
 def add_email_account(provider: str, email: str) -> str:
@@ -68,6 +68,24 @@ def list_accounts(service_type: str | None = None):
         return [dict(row) for row in rows]
 
 
+def list_signal_phones() -> list[str]:
+    with get_db() as conn:
+        rows = conn.execute(
+            "SELECT email FROM accounts WHERE service_type = 'messaging' AND provider = 'signal'"
+        ).fetchall()
+        return [row["email"] for row in rows]
+
+
+def find_accounts(prefix_or_email: str) -> list[dict[str, Any]]:
+    lo, hi = prefix_bounds(prefix_or_email)
+    with get_db() as conn:
+        rows = conn.execute(
+            "SELECT id, provider, email FROM accounts WHERE (id >= ? AND id < ?) OR email = ?",
+            (lo, hi, prefix_or_email),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+
 def select_email_account(email: str | None) -> tuple[dict[str, Any] | None, str | None]:
     accounts = list_accounts("email")
     if not accounts:
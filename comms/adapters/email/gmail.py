@@ -139,28 +139,60 @@ def count_inbox_threads(email_addr: str) -> int:
     return label.get("threadsTotal", 0)
 
 
+LABEL_QUERIES = {
+    "inbox": "in:inbox",
+    "unread": "is:unread",
+    "archive": "-in:inbox -in:trash -in:spam",
+    "trash": "in:trash",
+    "starred": "is:starred",
+    "sent": "in:sent",
+}
+BATCH_LIMIT = 100  # Gmail rejects batches with more sub-requests
+
+
+def _label_query(label: str) -> str:
+    return LABEL_QUERIES.get(label, f"in:{label}")
+
+
+def _execute_batch(service, requests: list[Any]) -> list[dict[str, Any]]:
+    """Run requests as multipart batches, returning responses in request order."""
+    responses: list[dict[str, Any]] = [{} for _ in requests]
+    errors: list[Exception] = []
+
+    def callback(request_id: str, response: dict[str, Any], exception: Exception | None):
+        if exception is not None:
+            errors.append(exception)
+        else:
+            responses[int(request_id)] = response
+
+    for start in range(0, len(requests), BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=callback)
+        for i, request in enumerate(requests[start : start + BATCH_LIMIT], start):
+            batch.add(request, request_id=str(i))
+        batch.execute()
+
+    if errors:
+        raise errors[0]
+    return responses
+
+
 def list_threads(
     email_addr: str, label: str = "inbox", max_results: int = 50
 ) -> list[dict[str, Any]]:
     creds, _ = _get_credentials(email_addr)
     service = build("gmail", "v1", credentials=creds)
 
-    label_queries = {
-        "inbox": "in:inbox",
-        "unread": "is:unread",
-        "archive": "-in:inbox -in:trash -in:spam",
-        "trash": "in:trash",
-        "starred": "is:starred",
-        "sent": "in:sent",
-    }
-
-    query = label_queries.get(label, f"in:{label}")
-
-    results = service.users().threads().list(userId="me", q=query, maxResults=max_results).execute()
-
-    threads = []
-    for thread_ref in results.get("threads", []):
-        thread = (
+    results = (
+        service.users()
+        .threads()
+        .list(userId="me", q=_label_query(label), maxResults=max_results)
+        .execute()
+    )
+    thread_refs = results.get("threads", [])
+
+    hydrated = _execute_batch(
+        service,
+        [
             service.users()
             .threads()
             .get(
@@ -169,9 +201,12 @@ def list_threads(
                 format="metadata",
                 metadataHeaders=["From", "Subject", "Date"],
             )
-            .execute()
-        )
+            for thread_ref in thread_refs
+        ],
+    )
 
+    threads = []
+    for thread_ref, thread in zip(thread_refs, hydrated, strict=True):
         messages = thread.get("messages", [])
         if not messages:
             continue
@@ -186,12 +221,30 @@ def list_threads(
                 "from": headers.get("from", ""),
                 "subject": headers.get("subject", ""),
                 "date": headers.get("date", ""),
+                "timestamp": int(last_msg.get("internalDate", 0)),
             }
         )
 
     return threads
 
 
+def list_thread_ids(email_addr: str, labels: list[str], max_results: int = 100) -> list[str]:
+    """Thread IDs under each label, without hydrating them, in one batched request."""
+    creds, _ = _get_credentials(email_addr)
+    service = build("gmail", "v1", credentials=creds)
+
+    responses = _execute_batch(
+        service,
+        [
+            service.users()
+            .threads()
+            .list(userId="me", q=_label_query(label), maxResults=max_results)
+            for label in labels
+        ],
+    )
+    return [ref["id"] for response in responses for ref in response.get("threads", [])]
+
+
 def list_inbox_threads(email_addr: str, max_results: int = 50) -> list[dict[str, Any]]:
     return list_threads(email_addr, label="inbox", max_results=max_results)
 
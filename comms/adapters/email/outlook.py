@@ -1,6 +1,7 @@
 """Outlook adapter via Microsoft Graph API."""
 
 import re
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
@@ -194,6 +195,13 @@ def list_threads(email: str, label: str = "inbox", max_results: int = 50) -> lis
     return threads
 
 
+def list_thread_ids(email: str, labels: list[str], max_results: int = 100) -> Iterator[str]:
+    # Lazy per label: a caller that stops early skips the remaining Graph requests.
+    for label in labels:
+        for thread in list_threads(email, label, max_results):
+            yield thread["id"]
+
+
 def _format_recipients(recipients: list[dict[str, Any]]) -> str:
     parts = []
     for r in recipients:
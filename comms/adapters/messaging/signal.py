@@ -2,44 +2,56 @@ import io
 import json
 import re
 import subprocess
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import qrcode
 
-from comms.db import get_db
+from comms.db import get_db, prefix_bounds
 
 SIGNAL_CLI = "signal-cli"
 CONFIG_DIR = Path.home() / ".local/share/signal-cli"
+STATUS_TTL = 30.0
+
+INSERT_MESSAGE_SQL = """
+    INSERT OR IGNORE INTO signal_messages
+    (id, account_phone, sender_phone, sender_name, body, timestamp, group_id, received_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_accounts_cache: tuple[float, list[str]] | None = None
+_connection_cache: dict[str, tuple[float, tuple[bool, str]]] = {}
+
+
+def clear_status_cache() -> None:
+    global _accounts_cache
+    _accounts_cache = None
+    _connection_cache.clear()
 
 
 def _store_messages(phone: str, messages: list[dict[str, Any]]) -> int:
-    stored = 0
+    received_at = datetime.now().isoformat()
+    rows = [
+        (
+            msg["id"],
+            phone,
+            msg["from"],
+            msg.get("from_name", ""),
+            msg["body"],
+            msg["timestamp"],
+            msg.get("group"),
+            received_at,
+        )
+        for msg in messages
+    ]
     with get_db() as conn:
-        for msg in messages:
-            try:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO signal_messages
-                    (id, account_phone, sender_phone, sender_name, body, timestamp, group_id, received_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        msg["id"],
-                        phone,
-                        msg["from"],
-                        msg.get("from_name", ""),
-                        msg["body"],
-                        msg["timestamp"],
-                        msg.get("group"),
-                        datetime.now().isoformat(),
-                    ),
-                )
-                stored += 1
-            except Exception:  # noqa: S110
-                pass
-    return stored
+        # Take the write lock up front so a concurrent daemon poll can't force a retry mid-batch.
+        conn.execute("BEGIN IMMEDIATE")
+        before = conn.total_changes
+        conn.executemany(INSERT_MESSAGE_SQL, rows)
+        return conn.total_changes - before
 
 
 def get_messages(
@@ -47,6 +59,7 @@ def get_messages(
     sender: str | None = None,
     limit: int = 50,
     unread_only: bool = False,
+    oldest_first: bool = False,
 ) -> list[dict[str, Any]]:
     query = "SELECT * FROM signal_messages WHERE 1=1"
     params = []
@@ -62,6 +75,8 @@ def get_messages(
 
     query += " ORDER BY timestamp DESC LIMIT ?"
     params.append(limit)
+    if oldest_first:
+        query = f"SELECT * FROM ({query}) ORDER BY timestamp ASC"
 
     with get_db() as conn:
         rows = conn.execute(query, params).fetchall()
@@ -71,8 +86,8 @@ def get_messages(
 def get_message(message_id: str) -> dict[str, Any] | None:
     with get_db() as conn:
         row = conn.execute(
-            "SELECT * FROM signal_messages WHERE id = ? OR id LIKE ?",
-            (message_id, f"{message_id}%"),
+            "SELECT * FROM signal_messages WHERE id >= ? AND id < ? ORDER BY id LIMIT 1",
+            prefix_bounds(message_id),
         ).fetchone()
         return dict(row) if row else None
 
@@ -137,6 +152,9 @@ def _run(args: list[str], account: str | None = None) -> dict[str, Any] | list[A
 
 
 def list_accounts() -> list[str]:
+    global _accounts_cache
+    if _accounts_cache and time.monotonic() - _accounts_cache[0] < STATUS_TTL:
+        return list(_accounts_cache[1])
     result = subprocess.run(
         [SIGNAL_CLI, "listAccounts"],
         capture_output=True,
@@ -145,11 +163,13 @@ def list_accounts() -> list[str]:
     )
     if result.returncode != 0:
         return []
-    return [
+    accounts = [
         line.replace("Number: ", "").strip()
         for line in result.stdout.strip().split("\n")
         if line.startswith("Number: ")
     ]
+    _accounts_cache = (time.monotonic(), accounts)
+    return list(accounts)
 
 
 def is_registered(phone: str) -> bool:
@@ -175,6 +195,7 @@ def verify(phone: str, code: str) -> tuple[bool, str]:
         text=True,
     )
     if result.returncode == 0:
+        clear_status_cache()
         return True, "Verified successfully"
     return False, result.stderr or "Verification failed"
 
@@ -211,6 +232,7 @@ def link(device_name: str = "comms-cli") -> tuple[bool, str]:
     try:
         process.wait(timeout=120)
         if process.returncode == 0:
+            clear_status_cache()
             return True, "Linked successfully"
         return False, (process.stderr.read() if process.stderr else "") or "Link failed"
     except subprocess.TimeoutExpired:
@@ -263,17 +285,53 @@ def receive(phone: str, timeout: int = 1, store: bool = True) -> list[dict[str,
     return messages
 
 
-def send(phone: str, recipient: str, message: str, attachment: str | None = None) -> tuple[bool, str]:
+def send(
+    phone: str, recipient: str, message: str, attachment: str | None = None
+) -> tuple[bool, str]:
+    return _send(phone, [recipient], message, attachment)
+
+
+def _send(
+    phone: str, recipients: list[str], message: str, attachment: str | None = None
+) -> tuple[bool, str]:
     cmd = [SIGNAL_CLI, "-a", phone, "send"]
     if attachment:
         cmd.extend(["--attachment", attachment])
-    cmd.extend(["-m", message, recipient])
+    cmd.extend(["-m", message, *recipients])
     result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
     if result.returncode == 0:
         return True, "Sent"
     return False, result.stderr or "Send failed"
 
 
+def send_batch(phone: str, replies: list[tuple[str, str]]) -> list[tuple[bool, str]]:
+    """Send (recipient, message) pairs with one signal-cli call per distinct message.
+
+    Recipients getting the same text share a call. Each recipient's messages still go
+    out separately and in order. Results line up with `replies`.
+    """
+    results: list[tuple[bool, str]] = [(False, "Not sent")] * len(replies)
+    pending = list(enumerate(replies))
+    while pending:
+        # One message per recipient per round keeps each conversation in order.
+        this_round: dict[str, list[tuple[int, str]]] = {}
+        seen: set[str] = set()
+        later = []
+        for index, (recipient, message) in pending:
+            if recipient in seen:
+                later.append((index, (recipient, message)))
+                continue
+            seen.add(recipient)
+            this_round.setdefault(message, []).append((index, recipient))
+
+        for message, targets in this_round.items():
+            outcome = _send(phone, [recipient for _, recipient in targets], message)
+            for index, _ in targets:
+                results[index] = outcome
+        pending = later
+    return results
+
+
 def send_group(phone: str, group_id: str, message: str) -> tuple[bool, str]:
     result = subprocess.run(
         [SIGNAL_CLI, "-a", phone, "send", "-m", message, "-g", group_id],
@@ -305,9 +363,14 @@ def list_contacts(phone: str) -> list[dict[str, Any]]:
 
 
 def test_connection(phone: str) -> tuple[bool, str]:
+    cached = _connection_cache.get(phone)
+    if cached and time.monotonic() - cached[0] < STATUS_TTL:
+        return cached[1]
     if not is_registered(phone):
         return False, "Account not registered"
-    result = _run(["getUserStatus", phone], account=phone)
-    if result is None:
+    if _run(["getUserStatus", phone], account=phone) is None:
         return False, "Failed to get user status"
-    return True, "Connected"
+    # Only success is cached, so a freshly linked or recovered account shows up at once.
+    status = (True, "Connected")
+    _connection_cache[phone] = (time.monotonic(), status)
+    return status
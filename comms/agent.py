@@ -6,6 +6,7 @@ import subprocess
 from dataclasses import dataclass
 from typing import Any
 
+from .claude import run_claude
 from .config import COMMS_DIR
 
 AUTHORIZED_FILE = COMMS_DIR / "authorized_senders.txt"
@@ -124,20 +125,7 @@ OUTPUT FORMAT (JSON only, no explanation):
 If not a command request, return: {{"action": null}}"""
 
     try:
-        result = subprocess.run(
-            [
-                "claude",
-                "--print",
-                "--model",
-                "claude-haiku-4-5",
-                "-p",
-                prompt,
-                "--dangerously-skip-permissions",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        result = run_claude(prompt, "claude-haiku-4-5", timeout=30)
         if result.returncode != 0:
             return None
 
@@ -271,7 +259,7 @@ def process_message(
 
 
 def handle_incoming(phone: str, message: dict[str, Any], use_nlp: bool = False) -> str | None:
-    sender = message.get("sender_phone", "")
+    sender = message.get("from", "")
     body = message.get("body", "")
 
     result = process_message(phone, sender, body, use_nlp=use_nlp)
@@ -1,8 +1,14 @@
 import json
+import sqlite3
 from typing import Any
 
 from .db import get_db, now_iso
 
+INSERT_SQL = """
+    INSERT INTO audit_log (action, entity_type, entity_id, metadata, timestamp, proposed_action, user_decision, reasoning)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 def log(
     action: str,
@@ -12,26 +18,27 @@ def log(
     proposed_action: str | None = None,
     user_decision: str | None = None,
     reasoning: str | None = None,
+    conn: sqlite3.Connection | None = None,
 ) -> None:
+    """Append an audit entry; pass `conn` to commit it with the caller's write."""
     metadata_json = json.dumps(metadata) if metadata else None
+    params = (
+        action,
+        entity_type,
+        entity_id,
+        metadata_json,
+        now_iso(),
+        proposed_action,
+        user_decision,
+        reasoning,
+    )
+
+    if conn is not None:
+        conn.execute(INSERT_SQL, params)
+        return
 
     with get_db() as conn:
-        conn.execute(
-            """
-            INSERT INTO audit_log (action, entity_type, entity_id, metadata, timestamp, proposed_action, user_decision, reasoning)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                action,
-                entity_type,
-                entity_id,
-                metadata_json,
-                now_iso(),
-                proposed_action,
-                user_decision,
-                reasoning,
-            ),
-        )
+        conn.execute(INSERT_SQL, params)
 
 
 def get_recent_logs(limit: int = 50) -> list[dict[str, Any]]:
@@ -49,6 +56,22 @@ def get_recent_logs(limit: int = 50) -> list[dict[str, Any]]:
         return [dict(row) for row in rows]
 
 
+def list_recent_projected(limit: int = 50) -> list[tuple[str, str, str, str]]:
+    with get_db() as conn:
+        return [
+            tuple(row)
+            for row in conn.execute(
+                """
+                SELECT timestamp, action, entity_type, substr(entity_id, 1, 8)
+                FROM audit_log
+                ORDER BY timestamp DESC
+                LIMIT ?
+                """,
+                (limit,),
+            )
+        ]
+
+
 def log_decision(
     proposed_action: str,
     entity_type: str,
@@ -56,6 +79,7 @@ def log_decision(
     user_decision: str,
     reasoning: str | None = None,
     metadata: dict[str, Any] | None = None,
+    conn: sqlite3.Connection | None = None,
 ) -> None:
     log(
         action="decision",
@@ -65,4 +89,5 @@ def log_decision(
         proposed_action=proposed_action,
         user_decision=user_decision,
         reasoning=reasoning,
+        conn=conn,
     )
@@ -1,11 +1,87 @@
 """Headless Claude invocation for draft generation and summarization."""
 
+import os
+import shutil
 import subprocess
-from typing import Any
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from .contacts import get_contact_context
 from .templates import format_templates_for_prompt
 
+if TYPE_CHECKING:
+    import anthropic
+
+
+def run_claude(prompt: str, model: str, timeout: int) -> subprocess.CompletedProcess[str]:
+    """Headless `claude --print` with the prompt on stdin.
+
+    Every CLI-path call goes through here; triage's API path uses `stream_message` instead.
+    """
+    return subprocess.run(
+        ["claude", "--print", "--model", model, "--dangerously-skip-permissions"],
+        input=prompt,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+
+
+def api_available() -> bool:
+    return bool(os.environ.get("ANTHROPIC_API_KEY"))
+
+
+def cli_available() -> bool:
+    return shutil.which("claude") is not None
+
+
+@lru_cache(maxsize=1)
+def _client() -> "anthropic.Anthropic":
+    # Imported here so the daemon and agent, which only use the CLI, never load the SDK.
+    import anthropic  # noqa: PLC0415
+
+    # One client per process so repeat calls reuse its HTTP connection pool.
+    return anthropic.Anthropic()
+
+
+def stream_message(
+    system: str,
+    user: str,
+    model: str,
+    timeout: int,
+    max_tokens: int = 8192,
+    tool: dict[str, Any] | None = None,
+) -> Iterator[str]:
+    """Messages API call with `system` marked as a cacheable prompt prefix.
+
+    Yields response text as it arrives, or with `tool` set, forces that tool and yields
+    the raw JSON fragments of its input. Stops early on API failure (like a non-zero CLI exit).
+    """
+    import anthropic  # noqa: PLC0415
+
+    tool_kwargs: dict[str, Any] = {}
+    if tool:
+        tool_kwargs = {"tools": [tool], "tool_choice": {"type": "tool", "name": tool["name"]}}
+
+    try:
+        with _client().messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            system=[{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
+            messages=[{"role": "user", "content": user}],
+            timeout=timeout,
+            **tool_kwargs,
+        ) as stream:
+            if not tool:
+                yield from stream.text_stream
+                return
+            for event in stream:
+                if event.type == "content_block_delta" and event.delta.type == "input_json_delta":
+                    yield event.delta.partial_json
+    except anthropic.APIError:
+        return
+
 
 def _extract_sender_from_context(context: str) -> str:
     for line in context.split("\n"):
@@ -52,20 +128,7 @@ Acknowledging their update and confirming next steps.
 
 Thanks for the update. I'll review the proposal by Friday and get back to you with feedback."""
 
-    result = subprocess.run(
-        [
-            "claude",
-            "--print",
-            "--model",
-            model,
-            "-p",
-            prompt,
-            "--dangerously-skip-permissions",
-        ],
-        capture_output=True,
-        text=True,
-        timeout=60,
-    )
+    result = run_claude(prompt, model, timeout=60)
 
     if result.returncode != 0:
         return "", f"Claude failed: {result.stderr}"
@@ -126,20 +189,7 @@ Confirming the time works.
 
 Yeah 3pm works for me, see you then!"""
 
-    result = subprocess.run(
-        [
-            "claude",
-            "--print",
-            "--model",
-            model,
-            "-p",
-            prompt,
-            "--dangerously-skip-permissions",
-        ],
-        capture_output=True,
-        text=True,
-        timeout=60,
-    )
+    result = run_claude(prompt, model, timeout=60)
 
     if result.returncode != 0:
         return "", f"Claude failed: {result.stderr}"
@@ -183,20 +233,7 @@ THREAD:
 
 Respond with just the summary, no preamble."""
 
-    result = subprocess.run(
-        [
-            "claude",
-            "--print",
-            "--model",
-            model,
-            "-p",
-            prompt,
-            "--dangerously-skip-permissions",
-        ],
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
+    result = run_claude(prompt, model, timeout=30)
 
     if result.returncode != 0:
         return f"Summary failed: {result.stderr}"
@@ -2,8 +2,6 @@
 
 import typer
 
-from comms import db
-
 from .accounts import app as accounts_app
 from .daemon import app as daemon_app
 from .drafts import app as drafts_app
@@ -37,7 +35,6 @@ app.add_typer(proposals_app, name="")
 
 
 def main() -> None:
-    db.init()
     app()
 
 
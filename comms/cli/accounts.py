@@ -2,10 +2,6 @@
 
 import typer
 
-from comms import accounts as accts_module
-from comms.adapters.email import gmail, outlook
-from comms.adapters.messaging import signal
-
 app = typer.Typer()
 
 
@@ -21,11 +17,15 @@ def link(
     ),
 ) -> None:
     """Link email or messaging account"""
+    from comms import accounts as accts_module
+
     if provider not in ["gmail", "outlook", "signal"]:
         typer.echo(f"Unknown provider: {provider}")
         raise typer.Exit(1)
 
     if provider == "signal":
+        from comms.adapters.messaging import signal
+
         typer.echo("Linking Signal as secondary device...")
         typer.echo("Open Signal on your phone -> Settings -> Linked Devices -> Link New Device")
         typer.echo("Then scan the QR code that will appear.")
@@ -48,6 +48,8 @@ def link(
     email = identifier
     account_id: str = ""
     if provider == "gmail":
+        from comms.adapters.email import gmail
+
         try:
             email = gmail.init_oauth()
             typer.echo(f"OAuth completed: {email}")
@@ -62,6 +64,8 @@ def link(
             raise typer.Exit(1)
 
     elif provider == "outlook":
+        from comms.adapters.email import outlook
+
         if not email:
             typer.echo("Outlook requires email address")
             raise typer.Exit(1)
@@ -87,6 +91,8 @@ def link(
 @app.command()
 def accounts() -> None:
     """List all accounts"""
+    from comms import accounts as accts_module
+
     accts = accts_module.list_accounts()
     if not accts:
         typer.echo("No accounts configured")
@@ -100,12 +106,9 @@ def accounts() -> None:
 @app.command()
 def unlink(account_id: str) -> None:
     """Unlink account by ID or email"""
-    accounts = accts_module.list_accounts()
-    matching = [
-        account
-        for account in accounts
-        if account["id"].startswith(account_id) or account["email"] == account_id
-    ]
+    from comms import accounts as accts_module
+
+    matching = accts_module.find_accounts(account_id)
 
     if not matching:
         typer.echo(f"No account found matching: {account_id}")
@@ -2,10 +2,7 @@
 
 import typer
 
-from comms import drafts as drafts_module
-from comms import policy, services
-
-from .helpers import run_service
+from .helpers import EMAIL_OPT, run_service
 
 app = typer.Typer()
 
@@ -13,21 +10,26 @@ app = typer.Typer()
 @app.command()
 def drafts_list() -> None:
     """List pending drafts"""
-    pending = drafts_module.list_pending_drafts()
+    from comms import drafts as drafts_module
+
+    pending = drafts_module.list_pending_projected()
     if not pending:
         typer.echo("No pending drafts")
         return
 
-    for draft in pending:
-        status = "✓ approved" if draft.approved_at else "⧗ pending"
-        typer.echo(
-            f"{draft.id[:8]} | {draft.to_addr} | {draft.subject or '(no subject)'} | {status}"
+    typer.echo(
+        "\n".join(
+            f"{short_id} | {to_addr} | {subject} | {'✓ approved' if approved else '⧗ pending'}"
+            for short_id, to_addr, subject, approved in pending
         )
+    )
 
 
 @app.command()
 def draft_show(draft_id: str) -> None:
     """Show draft details"""
+    from comms import drafts as drafts_module
+
     draft = drafts_module.get_draft(draft_id)
     if not draft:
         typer.echo(f"Draft {draft_id} not found")
@@ -55,9 +57,11 @@ def compose(
     subject: str = typer.Option(None, "--subject", "-s"),
     body: str = typer.Option(None, "--body", "-b"),
     cc: str = typer.Option(None, "--cc"),
-    email: str = typer.Option(None, "--email", "-e"),
+    email: str = EMAIL_OPT,
 ) -> None:
     """Compose new email draft"""
+    from comms import services
+
     if not body:
         typer.echo("Error: --body required")
         raise typer.Exit(1)
@@ -83,22 +87,12 @@ def compose(
 @app.command()
 def approve_draft(draft_id: str) -> None:
     """Approve draft for sending"""
-    full_id = drafts_module.resolve_draft_id(draft_id) or draft_id
-    draft = drafts_module.get_draft(full_id)
-    if not draft:
-        typer.echo(f"Draft {draft_id} not found")
-        raise typer.Exit(1)
+    from comms import drafts as drafts_module
 
-    if draft.approved_at:
+    full_id = drafts_module.resolve_draft_id(draft_id) or draft_id
+    if not run_service(drafts_module.approve_draft, full_id):
         typer.echo("Draft already approved")
         return
-
-    allowed, error_msg = policy.check_recipient_allowed(draft.to_addr)
-    if not allowed:
-        typer.echo(f"Cannot approve draft: {error_msg}")
-        raise typer.Exit(1)
-
-    drafts_module.approve_draft(full_id)
     typer.echo(f"Approved draft {full_id[:8]}")
     typer.echo(f"\nRun `comms send {full_id[:8]}` to send")
 
@@ -107,10 +101,12 @@ def approve_draft(draft_id: str) -> None:
 def reply(
     thread_id: str,
     body: str = typer.Option(None, "--body", "-b"),
-    email: str = typer.Option(None, "--email", "-e"),
+    email: str = EMAIL_OPT,
     reply_all: bool = typer.Option(False, "--all", "-a", help="Reply to all recipients"),
 ) -> None:
     """Reply to thread"""
+    from comms import services
+
     if not body:
         typer.echo("Error: --body required")
         raise typer.Exit(1)
@@ -131,11 +127,11 @@ def reply(
 def draft_reply(
     thread_id: str,
     instructions: str = typer.Option(None, "--instructions", "-i", help="Instructions for Claude"),
-    email: str = typer.Option(None, "--email", "-e"),
+    email: str = EMAIL_OPT,
     reply_all: bool = typer.Option(False, "--all", "-a", help="Reply to all recipients"),
 ) -> None:
     """Generate reply draft using Claude"""
-    from comms import claude
+    from comms import claude, services
 
     full_id = run_service(services.resolve_thread_id, thread_id, email) or thread_id
     thread_messages = run_service(services.fetch_thread, full_id, email)
@@ -177,6 +173,9 @@ def draft_reply(
 @app.command()
 def send(draft_id: str) -> None:
     """Send approved draft"""
+    from comms import drafts as drafts_module
+    from comms import services
+
     full_id = drafts_module.resolve_draft_id(draft_id) or draft_id
     draft = drafts_module.get_draft(full_id)
     if not draft:
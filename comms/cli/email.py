@@ -2,9 +2,7 @@
 
 import typer
 
-from comms import audit, services
-
-from .helpers import run_service
+from .helpers import EMAIL_OPT, run_service
 
 app = typer.Typer()
 
@@ -14,42 +12,51 @@ def threads(
     label: str = typer.Option(
         "inbox", "--label", "-l", help="Label filter: inbox, unread, archive, trash, starred, sent"
     ),
+    limit: int = typer.Option(50, "--limit", "-n", help="Max threads per account"),
 ) -> None:
     """List threads from all accounts"""
-    for entry in services.list_threads(label):
+    from comms import services
+
+    lines: list[str] = []
+    for entry in services.list_threads(label, limit=limit):
         account = entry["account"]
         thread_list = entry["threads"]
-        typer.echo(f"\n{account['email']} ({label}):")
+        lines.append(f"\n{account['email']} ({label}):")
 
         if not thread_list:
-            typer.echo("  No threads")
+            lines.append("  No threads")
             continue
 
         for thread in thread_list:
             date_str = thread.get("date", "")[:16]
-            typer.echo(f"  {thread['id'][:8]} | {date_str:16} | {thread['snippet'][:50]}")
+            lines.append(f"  {thread['id'][:8]} | {date_str:16} | {thread['snippet'][:50]}")
+
+    if lines:
+        typer.echo("\n".join(lines))
 
 
 @app.command()
-def thread(thread_id: str, email: str = typer.Option(None, "--email", "-e")) -> None:
+def thread(thread_id: str, email: str = EMAIL_OPT) -> None:
     """Fetch and display full thread"""
+    from comms import services
+
     full_id = run_service(services.resolve_thread_id, thread_id, email) or thread_id
     thread_messages = run_service(services.fetch_thread, full_id, email)
 
-    typer.echo(f"\nThread: {thread_messages[0]['subject']}")
-    typer.echo("=" * 80)
-
+    lines = [f"\nThread: {thread_messages[0]['subject']}", "=" * 80]
     for message in thread_messages:
-        typer.echo(f"\nFrom: {message['from']}")
-        typer.echo(f"Date: {message['date']}")
-        typer.echo(f"\n{message['body']}\n")
-        typer.echo("-" * 80)
+        lines.append(f"\nFrom: {message['from']}")
+        lines.append(f"Date: {message['date']}")
+        lines.append(f"\n{message['body']}\n")
+        lines.append("-" * 80)
+
+    typer.echo("\n".join(lines))
 
 
 @app.command()
-def summarize(thread_id: str, email: str = typer.Option(None, "--email", "-e")) -> None:
+def summarize(thread_id: str, email: str = EMAIL_OPT) -> None:
     """Summarize thread using Claude"""
-    from comms import claude
+    from comms import claude, services
 
     full_id = run_service(services.resolve_thread_id, thread_id, email) or thread_id
     thread_messages = run_service(services.fetch_thread, full_id, email)
@@ -65,9 +72,10 @@ def snooze(
     until: str = typer.Option(
         "tomorrow", "--until", "-u", help="When to resurface: tomorrow, monday, 2d, 4h"
     ),
-    email: str = typer.Option(None, "--email", "-e"),
+    email: str = EMAIL_OPT,
 ) -> None:
     """Snooze thread until later"""
+    from comms import services
     from comms import snooze as snooze_module
 
     full_id = run_service(services.resolve_thread_id, thread_id, email) or thread_id
@@ -98,46 +106,52 @@ def snoozed() -> None:
 
 
 @app.command()
-def archive(thread_id: str, email: str = typer.Option(None, "--email", "-e")) -> None:
+def archive(thread_id: str, email: str = EMAIL_OPT) -> None:
     """Archive thread (remove from inbox)"""
+    from comms import audit, services
+
     run_service(services.thread_action, "archive", thread_id, email)
     typer.echo(f"Archived thread: {thread_id}")
     audit.log("archive", "thread", thread_id, {"reason": "manual"})
 
 
 @app.command()
-def delete(thread_id: str, email: str = typer.Option(None, "--email", "-e")) -> None:
+def delete(thread_id: str, email: str = EMAIL_OPT) -> None:
     """Delete thread (move to trash)"""
+    from comms import audit, services
+
     run_service(services.thread_action, "delete", thread_id, email)
     typer.echo(f"Deleted thread: {thread_id}")
     audit.log("delete", "thread", thread_id, {"reason": "manual"})
 
 
 @app.command()
-def flag(thread_id: str, email: str = typer.Option(None, "--email", "-e")) -> None:
+def flag(thread_id: str, email: str = EMAIL_OPT) -> None:
     """Flag thread (star it)"""
     _thread_action(thread_id, "flag", email)
 
 
 @app.command()
-def unflag(thread_id: str, email: str = typer.Option(None, "--email", "-e")) -> None:
+def unflag(thread_id: str, email: str = EMAIL_OPT) -> None:
     """Unflag thread (unstar it)"""
     _thread_action(thread_id, "unflag", email)
 
 
 @app.command()
-def unarchive(thread_id: str, email: str = typer.Option(None, "--email", "-e")) -> None:
+def unarchive(thread_id: str, email: str = EMAIL_OPT) -> None:
     """Unarchive thread (restore to inbox)"""
     _thread_action(thread_id, "unarchive", email)
 
 
 @app.command()
-def undelete(thread_id: str, email: str = typer.Option(None, "--email", "-e")) -> None:
+def undelete(thread_id: str, email: str = EMAIL_OPT) -> None:
     """Undelete thread (restore from trash)"""
     _thread_action(thread_id, "undelete", email)
 
 
 def _thread_action(thread_id: str, action_name: str, email: str | None = None) -> None:
+    from comms import audit, services
+
     run_service(services.thread_action, action_name, thread_id, email)
     past_tense = f"{action_name}ged" if action_name.endswith("flag") else f"{action_name}d"
     typer.echo(f"{past_tense.capitalize()} thread: {thread_id}")
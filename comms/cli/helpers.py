@@ -1,9 +1,24 @@
 """Shared CLI helpers."""
 
+import time
+from functools import lru_cache
+
 import typer
 
 from comms import accounts as accts_module
 
+EMAIL_OPT = typer.Option(None, "--email", "-e")
+PHONE_OPT = typer.Option(None, "--phone", "-p")
+
+
+@lru_cache(maxsize=1024)
+def _format_minute(minute: int) -> str:
+    return time.strftime("%m-%d %H:%M", time.localtime(minute * 60))
+
+
+def format_ts(ts_ms: int) -> str:
+    return _format_minute(ts_ms // 60000)
+
 
 def run_service(fn, *args, **kwargs):
     try:
@@ -16,9 +31,8 @@ def run_service(fn, *args, **kwargs):
 def get_signal_phone(phone: str | None) -> str:
     if phone:
         return phone
-    accounts = accts_module.list_accounts("messaging")
-    signal_accounts = [account for account in accounts if account["provider"] == "signal"]
-    if not signal_accounts:
+    phones = accts_module.list_signal_phones()
+    if not phones:
         typer.echo("No Signal accounts linked. Run: comms link signal")
         raise typer.Exit(1)
-    return signal_accounts[0]["email"]
+    return phones[0]
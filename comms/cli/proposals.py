@@ -1,9 +1,8 @@
 """Proposal management commands."""
 
-import typer
+from collections import defaultdict
 
-from comms import proposals as proposals_module
-from comms import services
+import typer
 
 app = typer.Typer()
 
@@ -16,29 +15,24 @@ def review(
     ),
 ) -> None:
     """Review proposals"""
-    proposals = proposals_module.list_proposals(status=status)
+    from comms import proposals as proposals_module
+    from comms.models import Proposal
 
-    if action:
-        proposals = [p for p in proposals if p["proposed_action"] == action]
+    proposals_by_action: defaultdict[str, list[Proposal]] = defaultdict(list)
+    for proposal in proposals_module.list_proposals(status=status, action=action):
+        proposals_by_action[proposal.proposed_action].append(proposal)
 
-    if not proposals:
+    if not proposals_by_action:
         typer.echo("No proposals")
         return
 
-    proposals_by_action = {}
-    for proposal in proposals:
-        action_type = proposal["proposed_action"]
-        if action_type not in proposals_by_action:
-            proposals_by_action[action_type] = []
-        proposals_by_action[action_type].append(proposal)
-
     for action_type in ["flag", "archive", "delete"]:
         if action_type not in proposals_by_action:
             continue
         typer.echo(f"\n=== {action_type.upper()} ({len(proposals_by_action[action_type])}) ===")
         for proposal in proposals_by_action[action_type]:
             typer.echo(
-                f"  {proposal['id'][:8]} | {proposal['agent_reasoning'] or proposal['entity_id'][:8]}"
+                f"  {proposal.id[:8]} | {proposal.agent_reasoning or proposal.entity_id[:8]}"
             )
 
 
@@ -50,6 +44,8 @@ def propose(
     agent: str = typer.Option(None, "--agent", help="Agent reasoning"),
 ) -> None:
     """Create proposal"""
+    from comms import proposals as proposals_module
+
     proposal_id, error, auto_approved = proposals_module.create_proposal(
         entity_type=entity_type,
         entity_id=entity_id,
@@ -75,19 +71,18 @@ def approve(
     action: str = typer.Option(None, "--action", "-a", help="Approve all with this action"),
 ) -> None:
     """Approve proposal(s)"""
+    from comms import proposals as proposals_module
+
     if all_pending or action:
-        pending_proposals = proposals_module.list_proposals(status="pending")
-        if action:
-            pending_proposals = [p for p in pending_proposals if p["proposed_action"] == action]
+        pending_proposals = proposals_module.list_proposals(status="pending", action=action)
 
         if not pending_proposals:
             typer.echo("No matching proposals")
             return
 
-        approved_count = 0
-        for proposal in pending_proposals:
-            if proposals_module.approve_proposal(proposal["id"], user_reasoning=human):
-                approved_count += 1
+        approved_count = sum(
+            proposals_module.approve_proposal(p.id, user_reasoning=human) for p in pending_proposals
+        )
         typer.echo(f"Approved {approved_count} proposals")
         return
 
@@ -113,21 +108,19 @@ def reject(
     action: str = typer.Option(None, "--action", "-a", help="Reject all with this action"),
 ) -> None:
     """Reject proposal(s) (optionally with correction)"""
+    from comms import proposals as proposals_module
+
     if all_pending or action:
-        pending_proposals = proposals_module.list_proposals(status="pending")
-        if action:
-            pending_proposals = [p for p in pending_proposals if p["proposed_action"] == action]
+        pending_proposals = proposals_module.list_proposals(status="pending", action=action)
 
         if not pending_proposals:
             typer.echo("No matching proposals")
             return
 
-        rejected_count = 0
-        for proposal in pending_proposals:
-            if proposals_module.reject_proposal(
-                proposal["id"], user_reasoning=human, correction=correct
-            ):
-                rejected_count += 1
+        rejected_count = sum(
+            proposals_module.reject_proposal(p.id, user_reasoning=human, correction=correct)
+            for p in pending_proposals
+        )
         typer.echo(f"Rejected {rejected_count} proposals")
         return
 
@@ -148,6 +141,9 @@ def reject(
 @app.command()
 def resolve() -> None:
     """Execute all approved proposals"""
+    from comms import proposals as proposals_module
+    from comms import services
+
     approved = proposals_module.get_approved_proposals()
     if not approved:
         typer.echo("No approved proposals to execute")
@@ -1,12 +1,12 @@
 """Signal messaging commands."""
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import typer
 
 from comms.adapters.messaging import signal as signal_module
 
-from .helpers import get_signal_phone
+from .helpers import PHONE_OPT, format_ts, get_signal_phone
 
 app = typer.Typer()
 
@@ -34,7 +34,7 @@ def messages(
 
 @app.command()
 def signal_inbox(
-    phone: str = typer.Option(None, "--phone", "-p"),
+    phone: str = PHONE_OPT,
 ) -> None:
     """Show Signal conversations"""
     phone = get_signal_phone(phone)
@@ -44,41 +44,46 @@ def signal_inbox(
         typer.echo("No conversations yet. Run: comms messages")
         return
 
+    lines = []
     for conversation in conversations:
         name = conversation["sender_name"] or conversation["sender_phone"]
         unread = conversation["unread_count"]
         count = conversation["message_count"]
         unread_str = f" ({unread} unread)" if unread else ""
-        typer.echo(f"{conversation['sender_phone']:16} | {name:20} | {count} msgs{unread_str}")
+        lines.append(f"{conversation['sender_phone']:16} | {name:20} | {count} msgs{unread_str}")
+    typer.echo("\n".join(lines))
 
 
 @app.command()
 def signal_history(
     contact: str = typer.Argument(..., help="Phone number to view history with"),
-    phone: str = typer.Option(None, "--phone", "-p"),
+    phone: str = PHONE_OPT,
     limit: int = typer.Option(20, "--limit", "-n"),
 ) -> None:
     """Show message history with a contact"""
     phone = get_signal_phone(phone)
 
-    history_messages = signal_module.get_messages(phone=phone, sender=contact, limit=limit)
+    history_messages = signal_module.get_messages(
+        phone=phone, sender=contact, limit=limit, oldest_first=True
+    )
     if not history_messages:
         typer.echo(f"No messages from {contact}")
         return
 
-    history_messages.reverse()
+    lines = []
     for message in history_messages:
         sender = message["sender_name"] or message["sender_phone"]
-        timestamp = datetime.fromtimestamp(message["timestamp"] / 1000).strftime("%m-%d %H:%M")
+        timestamp = format_ts(message["timestamp"])
         message_id = message["id"][:8] if message.get("id") else ""
-        typer.echo(f"{message_id} [{timestamp}] {sender}: {message['body']}")
+        lines.append(f"{message_id} [{timestamp}] {sender}: {message['body']}")
+    typer.echo("\n".join(lines))
 
 
 @app.command()
 def signal_send(
     recipient: str = typer.Argument(..., help="Phone number or group ID"),
     message: str = typer.Option(..., "--message", "-m", help="Message to send"),
-    phone: str = typer.Option(None, "--phone", "-p"),
+    phone: str = PHONE_OPT,
     group: bool = typer.Option(False, "--group", "-g", help="Send to group"),
     attachment: str = typer.Option(None, "--attachment", "-a", help="Path to attachment"),
 ) -> None:
@@ -101,7 +106,7 @@ def signal_send(
 def signal_reply(
     message_id: str = typer.Argument(..., help="Message ID to reply to"),
     message: str = typer.Option(..., "--message", "-m", help="Reply message"),
-    phone: str = typer.Option(None, "--phone", "-p"),
+    phone: str = PHONE_OPT,
 ) -> None:
     """Reply to a Signal message"""
     phone = get_signal_phone(phone)
@@ -121,7 +126,7 @@ def signal_reply(
 def signal_draft(
     contact: str = typer.Argument(..., help="Phone number to reply to"),
     instructions: str = typer.Option(None, "--instructions", "-i", help="Instructions for Claude"),
-    phone: str = typer.Option(None, "--phone", "-p"),
+    phone: str = PHONE_OPT,
 ) -> None:
     """Generate Signal reply using Claude"""
     from .. import claude
@@ -154,7 +159,7 @@ def signal_draft(
 
 
 @app.command()
-def signal_contacts(phone: str = typer.Option(None, "--phone", "-p")) -> None:
+def signal_contacts(phone: str = PHONE_OPT) -> None:
     """List Signal contacts"""
     phone = get_signal_phone(phone)
     contacts = signal_module.list_contacts(phone)
@@ -162,14 +167,15 @@ def signal_contacts(phone: str = typer.Option(None, "--phone", "-p")) -> None:
         typer.echo("No contacts")
         return
 
-    for contact in contacts:
-        name = contact.get("name", "")
-        number = contact.get("number", "")
-        typer.echo(f"{number:20} {name}")
+    typer.echo(
+        "\n".join(
+            f"{contact.get('number', ''):20} {contact.get('name', '')}" for contact in contacts
+        )
+    )
 
 
 @app.command()
-def signal_groups(phone: str = typer.Option(None, "--phone", "-p")) -> None:
+def signal_groups(phone: str = PHONE_OPT) -> None:
     """List Signal groups"""
     phone = get_signal_phone(phone)
     groups = signal_module.list_groups(phone)
@@ -190,7 +196,9 @@ def signal_status() -> None:
         typer.echo("Run: comms link signal")
         return
 
-    for phone in accounts:
-        success, error_msg = signal_module.test_connection(phone)
+    with ThreadPoolExecutor(max_workers=len(accounts)) as pool:
+        results = list(pool.map(signal_module.test_connection, accounts))
+
+    for phone, (success, error_msg) in zip(accounts, results, strict=True):
         status = "OK" if success else f"FAIL: {error_msg}"
         typer.echo(f"{phone}: {status}")
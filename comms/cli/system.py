@@ -1,36 +1,73 @@
 """System commands: init, backup, status, inbox, triage."""
 
-from datetime import datetime
+import contextlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import typer
 
-from comms import accounts as accts_module
-from comms import db, services
-from comms.adapters.email import gmail, outlook
+from comms import config, db
+
+from .helpers import format_ts
 
 app = typer.Typer()
 
+DASHBOARD_TTL = 2.0
+
+
+def _cached_dashboard_counts() -> tuple[int, int]:
+    mtime = list(db.change_token())
+
+    try:
+        cached = json.loads(config.DASHBOARD_CACHE_PATH.read_text())
+        if cached["mtime"] == mtime and time.time() - cached["cached_at"] < DASHBOARD_TTL:
+            return cached["pending"], cached["approved_unsent"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    with db.get_db() as conn:
+        pending_drafts, approved_unsent = conn.execute(
+            "SELECT COUNT(*) - COUNT(approved_at), COUNT(approved_at) FROM drafts "
+            "WHERE sent_at IS NULL"
+        ).fetchone()
+
+    with contextlib.suppress(OSError):
+        config.DASHBOARD_CACHE_PATH.write_text(
+            json.dumps(
+                {
+                    "mtime": mtime,
+                    "pending": pending_drafts,
+                    "approved_unsent": approved_unsent,
+                    "cached_at": time.time(),
+                }
+            )
+        )
+
+    return pending_drafts, approved_unsent
+
 
 def show_dashboard() -> None:
+    from comms import accounts as accts_module
+    from comms.adapters.email import gmail, outlook
+
+    counters = {
+        "gmail": gmail.count_inbox_threads,
+        "outlook": outlook.count_inbox_threads,
+    }
+
+    def count_inbox(account: dict[str, Any]) -> int:
+        counter = counters.get(account["provider"])
+        return counter(account["email"]) if counter else 0
+
     accounts = accts_module.list_accounts("email")
     total_inbox = 0
+    if accounts:
+        with ThreadPoolExecutor(max_workers=min(8, len(accounts))) as pool:
+            total_inbox = sum(pool.map(count_inbox, accounts))
 
-    for account in accounts:
-        if account["provider"] == "gmail":
-            count = gmail.count_inbox_threads(account["email"])
-            total_inbox += count
-        elif account["provider"] == "outlook":
-            count = outlook.count_inbox_threads(account["email"])
-            total_inbox += count
-
-    with db.get_db() as conn:
-        pending_drafts = conn.execute(
-            "SELECT COUNT(*) FROM drafts WHERE approved_at IS NULL AND sent_at IS NULL"
-        ).fetchone()[0]
-        approved_unsent = conn.execute(
-            "SELECT COUNT(*) FROM drafts WHERE approved_at IS NOT NULL AND sent_at IS NULL"
-        ).fetchone()[0]
+    pending_drafts, approved_unsent = _cached_dashboard_counts()
 
     typer.echo("Comms Dashboard\n")
     typer.echo(f"Inbox threads: {total_inbox}")
@@ -41,13 +78,15 @@ def show_dashboard() -> None:
 @app.command()
 def inbox(limit: int = typer.Option(20, "--limit", "-n")) -> None:
     """Unified inbox (email + signal, sorted by time)"""
+    from comms import services
+
     items = services.get_unified_inbox(limit=limit)
     if not items:
         typer.echo("Inbox empty")
         return
 
     for item in items:
-        ts = datetime.fromtimestamp(item.timestamp / 1000).strftime("%m-%d %H:%M")
+        ts = format_ts(item.timestamp)
         unread = "●" if item.unread else " "
         source = "📧" if item.source == "email" else "💬"
         typer.echo(f"{unread} {source} [{ts}] {item.sender[:20]:20} {item.preview}")
@@ -73,13 +112,14 @@ def backup() -> None:
 @app.command()
 def rules() -> None:
     """Show triage rules (edit at ~/.comms/rules.md)"""
-    from comms.config import RULES_PATH
+    from comms.config import RULES_PATH, load_rules
 
-    if not RULES_PATH.exists():
+    text = load_rules()
+    if not text and not RULES_PATH.exists():
         typer.echo(f"No rules file. Create one at: {RULES_PATH}")
         return
 
-    typer.echo(RULES_PATH.read_text())
+    typer.echo(text)
 
 
 @app.command()
@@ -196,22 +236,23 @@ def stats() -> None:
         typer.echo("No decision data yet")
         return
 
-    typer.echo("Action Stats:")
+    lines = ["Action Stats:"]
     for action, s in sorted(action_stats.items(), key=lambda x: -x[1].total):
-        typer.echo(
+        lines.append(
             f"  {action:12} | {s.total:3} total | {s.accuracy:.0%} accuracy | "
             f"{s.approved} approved, {s.rejected} rejected, {s.corrected} corrected"
         )
 
     patterns = learning.get_correction_patterns()
     if patterns:
-        typer.echo("\nCorrection Patterns:")
-        for p in patterns[:5]:
-            typer.echo(f"  {p['original']} → {p['corrected']} ({p['count']}x)")
+        lines.append("\nCorrection Patterns:")
+        lines.extend(f"  {p['original']} → {p['corrected']} ({p['count']}x)" for p in patterns[:5])
 
     suggestions = learning.suggest_auto_approve()
     if suggestions:
-        typer.echo(f"\nAuto-approve candidates (≥95% accuracy, ≥10 samples): {suggestions}")
+        lines.append(f"\nAuto-approve candidates (≥95% accuracy, ≥10 samples): {suggestions}")
+
+    typer.echo("\n".join(lines))
 
 
 @app.command()
@@ -246,11 +287,13 @@ def audit_log(limit: int = 20) -> None:
     """Show recent audit log"""
     from comms import audit
 
-    logs = audit.get_recent_logs(limit)
-    for log_entry in logs:
+    logs = audit.list_recent_projected(limit)
+    if logs:
         typer.echo(
-            f"{log_entry['timestamp']} | {log_entry['action']} | "
-            f"{log_entry['entity_type']}:{log_entry['entity_id'][:8]}"
+            "\n".join(
+                f"{timestamp} | {action} | {entity_type}:{short_id}"
+                for timestamp, action, entity_type, short_id in logs
+            )
         )
 
 
@@ -271,22 +314,23 @@ def triage(
     auto_execute: bool = typer.Option(False, "--execute", "-x", help="Auto-execute after approval"),
 ) -> None:
     """Triage inbox — Claude bulk-proposes actions"""
+    from comms import services
     from comms import triage as triage_module
 
-    typer.echo("Scanning inbox...")
-    triage_proposals = triage_module.triage_inbox(limit=limit)
+    typer.echo("Scanning inbox...\n")
+    triage_proposals = []
+    for p in triage_module.iter_triage(limit=limit):
+        triage_proposals.append(p)
+        conf = f"{p.confidence:.0%}"
+        source = "📧" if p.item.source == "email" else "💬"
+        skip = " (skip)" if p.confidence < confidence or p.action == "ignore" else ""
+        typer.echo(f"{source} [{conf}] {p.action:10} {p.item.sender[:20]:20} {p.reasoning}{skip}")
 
     if not triage_proposals:
         typer.echo("No items to triage or triage failed")
         return
 
-    typer.echo(f"\nFound {len(triage_proposals)} proposals:\n")
-
-    for p in triage_proposals:
-        conf = f"{p.confidence:.0%}"
-        source = "📧" if p.item.source == "email" else "💬"
-        skip = " (skip)" if p.confidence < confidence or p.action == "ignore" else ""
-        typer.echo(f"{source} [{conf}] {p.action:10} {p.item.sender[:20]:20} {p.reasoning}{skip}")
+    typer.echo(f"\nFound {len(triage_proposals)} proposals")
 
     created = triage_module.create_proposals_from_triage(
         triage_proposals,
@@ -302,7 +346,7 @@ def triage(
 
     if auto_execute and created:
         typer.echo("\nExecuting approved proposals...")
-        results = services.execute_approved_proposals()
+        results = list(services.execute_approved_proposals())
         executed = sum(1 for r in results if r.success)
         typer.echo(f"Executed: {executed}/{len(results)}")
 
@@ -315,6 +359,7 @@ def clear(
 ) -> None:
     """One-command inbox clear: triage → approve → execute"""
     from comms import proposals as proposals_module
+    from comms import services
     from comms import triage as triage_module
 
     typer.echo("Scanning inbox...")
@@ -324,24 +369,19 @@ def clear(
         typer.echo("Inbox clear — nothing to triage")
         return
 
-    from comms.contacts import get_high_priority_patterns
-
-    high_priority = get_high_priority_patterns()
+    from comms.contacts import is_high_priority
 
-    def _is_high_priority(p: Any) -> bool:
-        sender_lower = p.item.sender.lower()
-        return any(pat in sender_lower for pat in high_priority)
-
-    auto_items = [
-        p
-        for p in triage_proposals
-        if p.confidence >= confidence and p.action != "ignore" and not _is_high_priority(p)
-    ]
-    review_items = [
-        p
-        for p in triage_proposals
-        if p.confidence < confidence or p.action == "ignore" or _is_high_priority(p)
-    ]
+    auto_items = []
+    review_items = []
+    for p in triage_proposals:
+        if (
+            p.confidence >= confidence
+            and p.action != "ignore"
+            and not is_high_priority(p.item.sender)
+        ):
+            auto_items.append(p)
+        else:
+            review_items.append(p)
 
     typer.echo(f"\nAuto ({len(auto_items)}) | Review ({len(review_items)})\n")
 
@@ -368,7 +408,7 @@ def clear(
     for pid, _ in created:
         proposals_module.approve_proposal(pid)
 
-    results = services.execute_approved_proposals()
+    results = list(services.execute_approved_proposals())
     executed = sum(1 for r in results if r.success)
 
     typer.echo(f"\nExecuted: {executed}/{len(results)}")
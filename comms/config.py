@@ -1,70 +1,147 @@
+import contextlib
+import copy
+import json
+import threading
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 COMMS_DIR = Path.home() / ".comms"
 DB_PATH = COMMS_DIR / "store.db"
 CONFIG_PATH = COMMS_DIR / "config.yaml"
 RULES_PATH = COMMS_DIR / "rules.md"
+DASHBOARD_CACHE_PATH = COMMS_DIR / "dashboard_cache.json"
+CONFIG_CACHE_PATH = COMMS_DIR / "config.cache.json"
 BACKUP_DIR = Path.home() / ".comms_backups"
 
 
 class Config:
-    _instance: ClassVar["Config | None"] = None
-    _data: ClassVar[dict[str, Any]] = {}
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            Config._data = {}
-            cls._instance._load()
-        return cls._instance
+    def __init__(self):
+        self._data: dict[str, Any] = {}
+        self._saved: dict[str, Any] = {}
+        self._load()
 
     def _load(self):
-        if not CONFIG_PATH.exists():
-            Config._data = {}
-            return
         try:
-            with CONFIG_PATH.open() as f:
-                Config._data = yaml.safe_load(f) or {}
+            st = CONFIG_PATH.stat()
+            if st.st_size == 0:
+                self._data = {}
+            else:
+                key = [st.st_mtime_ns, st.st_size]
+                cached = _read_cache(key)
+                if cached is not None:
+                    self._data = cached
+                else:
+                    with CONFIG_PATH.open("rb") as f:
+                        self._data = yaml.load(f, Loader=SafeLoader) or {}
+                    _write_cache(key, self._data)
         except Exception:
-            Config._data = {}
+            self._data = {}
+        self._saved = copy.deepcopy(self._data)
 
     def _save(self):
         COMMS_DIR.mkdir(exist_ok=True)
         with CONFIG_PATH.open("w") as f:
-            yaml.dump(self._data, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(
+                self._data, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True
+            )
+        st = CONFIG_PATH.stat()
+        _write_cache([st.st_mtime_ns, st.st_size], self._data)
+        self._saved = copy.deepcopy(self._data)
 
     def get(self, key: str, default=None):
         return self._data.get(key, default)
 
     def set(self, key: str, value) -> None:
-        self._data[key] = value
-        self._save()
+        self.update({key: value})
+
+    def update(self, values: dict[str, Any]) -> None:
+        self._data.update(values)
+        # Getters hand out the live dicts, so compare against what is on disk.
+        if self._data != self._saved:
+            self._save()
+
+
+def _read_cache(key: list[int]) -> dict[str, Any] | None:
+    """Parsed config from the JSON sidecar, if it was written for this YAML file state."""
+    try:
+        with CONFIG_CACHE_PATH.open("rb") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return cached.get("data")
+
+
+def _write_cache(key: list[int], data: dict[str, Any]) -> None:
+    tmp = CONFIG_CACHE_PATH.with_suffix(".tmp")
+    with contextlib.suppress(OSError):
+        try:
+            payload = json.dumps({"key": key, "data": data})
+            cacheable = json.loads(payload)["data"] == data
+        except (TypeError, ValueError):
+            cacheable = False
+        if not cacheable:
+            # Dates, sets or non-string keys don't survive JSON — parse the YAML every time.
+            CONFIG_CACHE_PATH.unlink(missing_ok=True)
+            return
+        tmp.write_text(payload)
+        tmp.replace(CONFIG_CACHE_PATH)
+
+
+_config: Config | None = None
+_config_lock = threading.Lock()
+_rules_cache: tuple[tuple[int, int], str] | None = None
+
+
+def _get_config() -> Config:
+    global _config
+    if _config is None:
+        with _config_lock:
+            if _config is None:
+                _config = Config()
+    return _config
 
 
-_config = Config()
+def load_rules() -> str:
+    """Contents of the triage rules file ("" if absent), reread only when it changes."""
+    global _rules_cache
+    try:
+        st = RULES_PATH.stat()
+    except FileNotFoundError:
+        return ""
+    key = (st.st_mtime_ns, st.st_size)
+    if _rules_cache is None or _rules_cache[0] != key:
+        _rules_cache = (key, RULES_PATH.read_text())
+    return _rules_cache[1]
 
 
 def get_accounts(service_type: str | None = None) -> dict[str, Any] | list[Any]:
-    accounts: dict[str, Any] = _config.get("accounts", {}) or {}
+    accounts: dict[str, Any] = _get_config().get("accounts", {}) or {}
     if service_type:
         return accounts.get(service_type, [])
     return accounts
 
 
 def add_account(service_type: str, account_data: dict[str, Any]) -> None:
-    accounts: dict[str, Any] = _config.get("accounts", {}) or {}
+    accounts: dict[str, Any] = _get_config().get("accounts", {}) or {}
     if service_type not in accounts:
         accounts[service_type] = []
     accounts[service_type].append(account_data)
-    _config.set("accounts", accounts)
+    _get_config().set("accounts", accounts)
 
 
 def get_policy() -> dict[str, Any]:
     return (
-        _config.get(
+        _get_config().get(
             "policy",
             {
                 "allowed_recipients": [],
@@ -84,12 +161,12 @@ def get_policy() -> dict[str, Any]:
 
 
 def set_policy(policy):
-    _config.set("policy", policy)
+    _get_config().set("policy", policy)
 
 
 def get_agent_config() -> dict[str, Any]:
     return (
-        _config.get(
+        _get_config().get(
             "agent",
             {
                 "enabled": True,
@@ -101,4 +178,4 @@ def get_agent_config() -> dict[str, Any]:
 
 
 def set_agent_config(config):
-    _config.set("agent", config)
+    _get_config().set("agent", config)
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
 
 CONTACTS_PATH = Path.home() / ".comms" / "contacts.md"
 PEEPS_DIR = Path.home() / "life" / "peeps"
+SENDER_MEMO_SIZE = 4096
 
 
 @dataclass
@@ -15,6 +17,25 @@ class ContactNote:
     tags: list[str]
     notes: str
     high_priority: bool = False
+    _pattern_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._pattern_lower = self.pattern.lower()
+
+
+@dataclass(slots=True)
+class _ContactIndex:
+    key: tuple[tuple[int, int] | None, tuple[tuple[str, tuple[int, int] | None], ...]]
+    contacts: list[ContactNote]
+    matcher: re.Pattern[str] | None
+    high_priority: re.Pattern[str] | None
+    # Senders repeat heavily (daemon polls, triage batches); remember each answer
+    # until the source files change and the whole index is rebuilt.
+    by_sender: dict[str, ContactNote | None] = field(default_factory=dict)
+    prompt: str | None = None
+
+
+_cache: _ContactIndex | None = None
 
 
 def _parse_md_contacts(path: Path) -> list[ContactNote]:
@@ -58,12 +79,15 @@ def _parse_md_contacts(path: Path) -> list[ContactNote]:
     return contacts
 
 
-def _load_peeps() -> list[ContactNote]:
+def _peep_files() -> list[Path]:
     if not PEEPS_DIR.exists():
         return []
+    return sorted(PEEPS_DIR.glob("*.md"))
+
 
+def _load_peeps(peep_files: list[Path]) -> list[ContactNote]:
     contacts = []
-    for peep_file in PEEPS_DIR.glob("*.md"):
+    for peep_file in peep_files:
         try:
             text = peep_file.read_text()
             lines = text.splitlines()
@@ -95,48 +119,105 @@ def _load_peeps() -> list[ContactNote]:
     return contacts
 
 
-def _load_contacts() -> list[ContactNote]:
-    contacts = []
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
-    if CONTACTS_PATH.exists():
-        contacts.extend(_parse_md_contacts(CONTACTS_PATH))
 
-    contacts.extend(_load_peeps())
+def _compile_matcher(contacts: list[ContactNote]) -> re.Pattern[str] | None:
+    """Compile every contact pattern into one case-folded regex.
 
-    return contacts
+    `*suffix` patterns match the end of the sender, anything else is a substring.
+    Each contact becomes a lookahead anchored at the start of the sender, so the
+    alternation tries them in list order and `lastindex` names the first hit.
+    """
+    branches = []
+    for contact in contacts:
+        pattern_lower = contact._pattern_lower
+        if "@" not in pattern_lower and pattern_lower.startswith("*"):
+            branches.append(f"(?=.*({re.escape(pattern_lower[1:])})\\Z)")
+        else:
+            branches.append(f"(?=.*?({re.escape(pattern_lower)}))")
+    if not branches:
+        return None
+    return re.compile("|".join(branches), re.DOTALL)
+
+
+def _compile_high_priority(contacts: list[ContactNote]) -> re.Pattern[str] | None:
+    patterns = [re.escape(c._pattern_lower) for c in contacts if c.high_priority]
+    if not patterns:
+        return None
+    return re.compile("|".join(patterns))
+
+
+def _load() -> _ContactIndex:
+    global _cache
+    peep_files = _peep_files()
+    key = (_stat_key(CONTACTS_PATH), tuple((p.name, _stat_key(p)) for p in peep_files))
+    if _cache and _cache.key == key:
+        return _cache
 
+    contacts = []
 
-def _match_sender(pattern: str, sender: str) -> bool:
-    sender_lower = sender.lower()
-    pattern_lower = pattern.lower()
+    if key[0] is not None:
+        contacts.extend(_parse_md_contacts(CONTACTS_PATH))
 
-    if "@" in pattern_lower:
-        return pattern_lower in sender_lower
+    contacts.extend(_load_peeps(peep_files))
 
-    if pattern_lower.startswith("*"):
-        return sender_lower.endswith(pattern_lower[1:])
+    _cache = _ContactIndex(
+        key=key,
+        contacts=contacts,
+        matcher=_compile_matcher(contacts),
+        high_priority=_compile_high_priority(contacts),
+    )
+    return _cache
 
-    return pattern_lower in sender_lower
+
+def _load_contacts() -> list[ContactNote]:
+    return _load().contacts
 
 
 def get_contact_context(sender: str) -> ContactNote | None:
-    contacts = _load_contacts()
-    for contact in contacts:
-        if _match_sender(contact.pattern, sender):
-            return contact
-    return None
+    index = _load()
+    if sender in index.by_sender:
+        return index.by_sender[sender]
+
+    contact = None
+    if index.matcher is not None:
+        match = index.matcher.match(sender.lower())
+        if match and match.lastindex is not None:
+            contact = index.contacts[match.lastindex - 1]
+    if len(index.by_sender) >= SENDER_MEMO_SIZE:
+        index.by_sender.clear()
+    index.by_sender[sender] = contact
+    return contact
 
 
 def get_all_contacts() -> list[ContactNote]:
-    return _load_contacts()
+    return list(_load_contacts())
 
 
 def get_high_priority_patterns() -> list[str]:
-    return [c.pattern.lower() for c in _load_contacts() if c.high_priority]
+    return [c._pattern_lower for c in _load_contacts() if c.high_priority]
+
+
+def is_high_priority(sender: str) -> bool:
+    matcher = _load().high_priority
+    return matcher is not None and matcher.search(sender.lower()) is not None
 
 
 def format_contacts_for_prompt() -> str:
-    contacts = _load_contacts()
+    # Built once per index, so the prompt prefix stays byte-identical until the files change.
+    index = _load()
+    if index.prompt is None:
+        index.prompt = _format_contacts(index.contacts)
+    return index.prompt
+
+
+def _format_contacts(contacts: list[ContactNote]) -> str:
     if not contacts:
         return ""
 
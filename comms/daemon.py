@@ -1,9 +1,11 @@
 import os
 import signal
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from . import accounts as accts_module
 from . import agent
@@ -14,15 +16,47 @@ PID_FILE = COMMS_DIR / "daemon.pid"
 LOG_FILE = COMMS_DIR / "daemon.log"
 
 
+_log_fh: TextIO | None = None
+_log_lock = threading.RLock()  # re-entered if a shutdown signal lands mid-write
+
+
 def _log(msg: str) -> None:
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    with LOG_FILE.open("a") as f:
-        f.write(f"{timestamp} {msg}\n")
+    line = f"{time.strftime('%Y-%m-%d %H:%M:%S')} {msg}\n"
+    with _log_lock:
+        if _log_fh is not None:
+            _log_fh.write(line)
+            return
+        with LOG_FILE.open("a") as f:
+            f.write(line)
 
 
 def _get_signal_phones() -> list[str]:
-    accounts = accts_module.list_accounts("messaging")
-    return [a["email"] for a in accounts if a["provider"] == "signal"]
+    return accts_module.list_signal_phones()
+
+
+def _poll_phone(phone: str, timeout: int, agent_enabled: bool, use_nlp: bool) -> int:
+    try:
+        msgs = signal_adapter.receive(phone, timeout=timeout, store=True)
+        replies: list[tuple[str, str]] = []
+        for m in msgs:
+            sender = m.get("from_name") or m.get("from", "Unknown")
+            _log(f"[{phone}] {sender}: {m['body'][:50]}")
+
+            if agent_enabled:
+                response = agent.handle_incoming(phone, m, use_nlp=use_nlp)
+                if response and m.get("from"):
+                    replies.append((m["from"], response))
+
+        # Each send spawns signal-cli, so replies go out together once the batch is handled.
+        if replies:
+            for (recipient, response), (ok, error) in zip(
+                replies, signal_adapter.send_batch(phone, replies), strict=True
+            ):
+                _log(f"[{phone}] -> {recipient}: {response[:50] if ok else error}")
+        return len(msgs)
+    except Exception as e:
+        _log(f"[{phone}] Error: {e}")
+        return 0
 
 
 def _poll_once(phones: list[str], timeout: int = 1) -> int:
@@ -30,42 +64,35 @@ def _poll_once(phones: list[str], timeout: int = 1) -> int:
     agent_enabled = bool(agent_config.get("enabled", True))
     use_nlp = bool(agent_config.get("nlp", False))
 
-    total = 0
-    for phone in phones:
-        try:
-            msgs = signal_adapter.receive(phone, timeout=timeout, store=True)
-            if msgs:
-                total += len(msgs)
-                for m in msgs:
-                    sender = m.get("from_name", m.get("sender_phone", "Unknown"))
-                    _log(f"[{phone}] {sender}: {m['body'][:50]}")
-
-                    if agent_enabled:
-                        response = agent.handle_incoming(phone, m, use_nlp=use_nlp)
-                        if response:
-                            sender_phone = m.get("sender_phone", "")
-                            if sender_phone:
-                                signal_adapter.send(phone, sender_phone, response)
-                                _log(f"[{phone}] -> {sender_phone}: {response[:50]}")
-        except Exception as e:
-            _log(f"[{phone}] Error: {e}")
-    return total
+    if len(phones) == 1:
+        return _poll_phone(phones[0], timeout, agent_enabled, use_nlp)
+
+    # Phones are independent: one slow receive or agent reply shouldn't hold up
+    # the others. Messages for a single phone stay in order on its own worker.
+    with ThreadPoolExecutor(max_workers=len(phones) or 1) as pool:
+        return sum(
+            pool.map(lambda phone: _poll_phone(phone, timeout, agent_enabled, use_nlp), phones)
+        )
 
 
 def run(interval: int = 5) -> None:
+    global _log_fh
     phones = _get_signal_phones()
     if not phones:
         sys.stdout.write("No Signal accounts linked\n")
         sys.exit(1)
 
+    pid = os.getpid()
     with PID_FILE.open("w") as f:
-        f.write(str(os.getpid()))
+        f.write(f"{pid} {_start_time(pid) or ''}".rstrip())
 
-    running = True
+    # Held open for the daemon's lifetime; line buffering keeps the log tail-able.
+    _log_fh = LOG_FILE.open("a", buffering=1)
+
+    stopping = threading.Event()
 
     def handle_signal(signum, frame):
-        nonlocal running
-        running = False
+        stopping.set()
         _log("Shutdown signal received")
 
     signal.signal(signal.SIGTERM, handle_signal)
@@ -74,12 +101,17 @@ def run(interval: int = 5) -> None:
     _log(f"Daemon started, polling {len(phones)} account(s) every {interval}s")
     sys.stdout.write(f"Daemon started (PID {os.getpid()})\n")
 
-    while running:
+    while not stopping.is_set():
+        started = time.monotonic()
         _poll_once(phones, timeout=1)
-        time.sleep(interval)
+        # Fixed cadence: the poll itself counts toward the interval, and a
+        # shutdown signal interrupts the wait instead of sleeping it out.
+        stopping.wait(max(0.0, interval - (time.monotonic() - started)))
 
     PID_FILE.unlink(missing_ok=True)
     _log("Daemon stopped")
+    _log_fh.close()
+    _log_fh = None
 
 
 def start(interval: int = 5, foreground: bool = False) -> tuple[bool, str]:
@@ -115,7 +147,7 @@ def start(interval: int = 5, foreground: bool = False) -> tuple[bool, str]:
 
 def stop() -> tuple[bool, str]:
     pid = get_pid()
-    if not pid:
+    if not pid or not is_running():
         return False, "Not running"
 
     try:
@@ -132,19 +164,41 @@ def stop() -> tuple[bool, str]:
         return True, "Was not running"
 
 
-def get_pid() -> int | None:
-    if not PID_FILE.exists():
+def _start_time(pid: int) -> str | None:
+    """Process start time from /proc (Linux), used to tell a reused PID apart."""
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
         return None
+    # comm (field 2) may contain spaces; fields after its closing paren are fixed.
+    return stat[stat.rfind(")") + 2 :].split()[19]
+
+
+def _read_pid_file() -> tuple[int, str | None] | None:
     try:
-        return int(PID_FILE.read_text().strip())
-    except (ValueError, FileNotFoundError):
+        parts = PID_FILE.read_text().split()
+        return int(parts[0]), parts[1] if len(parts) > 1 else None
+    except (ValueError, IndexError, FileNotFoundError):
         return None
 
 
+def get_pid() -> int | None:
+    entry = _read_pid_file()
+    return entry[0] if entry else None
+
+
 def is_running() -> bool:
-    pid = get_pid()
-    if not pid:
+    entry = _read_pid_file()
+    if not entry:
+        return False
+    pid, recorded_start = entry
+
+    if recorded_start is not None and Path("/proc").is_dir():
+        if _start_time(pid) == recorded_start:
+            return True
+        PID_FILE.unlink(missing_ok=True)
         return False
+
     try:
         os.kill(pid, 0)
         return True
@@ -153,6 +207,17 @@ def is_running() -> bool:
         return False
 
 
+def _tail(path: Path, n: int, block: int = 4096) -> list[str]:
+    with path.open("rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        start = max(0, size - block)
+        f.seek(start)
+        lines = f.read().decode("utf-8", "replace").strip().split("\n")
+    if start > 0 and len(lines) > 1:
+        lines = lines[1:]  # first line was cut by the seek
+    return lines[-n:]
+
+
 def status() -> dict[str, Any]:
     pid = get_pid()
     running = is_running()
@@ -166,7 +231,6 @@ def status() -> dict[str, Any]:
     }
 
     if LOG_FILE.exists():
-        lines = LOG_FILE.read_text().strip().split("\n")
-        result["last_log"] = lines[-5:] if len(lines) > 5 else lines
+        result["last_log"] = _tail(LOG_FILE, 5)
 
     return result
@@ -1,24 +1,69 @@
-import shutil
 import sqlite3
-from contextlib import contextmanager
+import threading
+from contextlib import closing, contextmanager
 from datetime import datetime
 from pathlib import Path
 
 from . import config
 
 MIGRATIONS_TABLE = "_migrations"
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+STATEMENT_CACHE_SIZE = 512
+
+_initialized = False
+_init_lock = threading.Lock()
 
 
 def now_iso() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
 
+def prefix_bounds(prefix: str) -> tuple[str, str]:
+    """Half-open range [lo, hi) covering every string starting with prefix.
+
+    `col >= lo AND col < hi` seeks on an index where `col LIKE 'prefix%'` scans.
+    """
+    if not prefix:
+        return "", "\U0010ffff"
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def change_token(db_path: Path | None = None) -> tuple[int, int]:
+    """Cheap fingerprint that changes whenever the database is written.
+
+    In WAL mode commits land in the -wal file and only reach the main file on
+    checkpoint, so both mtimes are needed.
+    """
+    db_path = db_path or config.DB_PATH
+    token = []
+    for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+        try:
+            token.append(path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            token.append(0)
+    return token[0], token[1]
+
+
+def _ensure_initialized() -> None:
+    if _initialized:
+        return
+    with _init_lock:
+        if not _initialized:
+            init()
+
+
 @contextmanager
 def get_db(db_path: Path | None = None):
+    if db_path is None:
+        _ensure_initialized()
     db_path = db_path if db_path else config.DB_PATH
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, cached_statements=STATEMENT_CACHE_SIZE)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA mmap_size = 268435456;")
+    conn.execute("PRAGMA cache_size = -8000;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
     try:
         yield conn
         conn.commit()
@@ -29,13 +74,16 @@ def get_db(db_path: Path | None = None):
         conn.close()
 
 
+def schema_version() -> int:
+    return sum(1 for _ in MIGRATIONS_DIR.glob("*.sql"))
+
+
 def load_migrations() -> list[tuple[str, str]]:
-    migrations_dir = Path(__file__).parent / "migrations"
-    if not migrations_dir.exists():
+    if not MIGRATIONS_DIR.exists():
         return []
 
     migrations = []
-    for sql_file in sorted(migrations_dir.glob("*.sql")):
+    for sql_file in sorted(MIGRATIONS_DIR.glob("*.sql")):
         name = sql_file.stem
         sql_content = sql_file.read_text()
         migrations.append((name, sql_content))
@@ -56,19 +104,33 @@ def backup_db(db_path: Path | None = None) -> Path | None:
     backup_dir.mkdir(parents=True, exist_ok=True)
 
     backup_path = backup_dir / db_path.name
-    shutil.copy2(db_path, backup_path)
+    # In WAL mode committed pages can still sit in the -wal file (synchronous=NORMAL
+    # defers checkpoints), so copy through SQLite rather than the main file alone.
+    with closing(sqlite3.connect(db_path)) as src, closing(sqlite3.connect(backup_path)) as dst:
+        src.backup(dst)
 
     return backup_path
 
 
 def init(db_path: Path | None = None):
+    global _initialized
     db_path = db_path if db_path else config.DB_PATH
+    version = schema_version()
 
     if db_path.exists() and db_path.stat().st_size > 0:
+        with get_db(db_path) as conn:
+            # WAL is persistent in the file header; set it here rather than on every connect.
+            conn.execute("PRAGMA journal_mode = WAL;")
+            current = conn.execute("PRAGMA user_version").fetchone()[0]
+        if current == version:
+            if db_path == config.DB_PATH:
+                _initialized = True
+            return
         backup_db(db_path)
 
     db_path.parent.mkdir(exist_ok=True)
     with get_db(db_path) as conn:
+        conn.execute("PRAGMA journal_mode = WAL;")
         create_migrations_table_sql = f"""
             CREATE TABLE IF NOT EXISTS {MIGRATIONS_TABLE} (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -86,3 +148,8 @@ def init(db_path: Path | None = None):
             if name not in applied_migrations:
                 conn.executescript(sql_content)
                 conn.execute(f"INSERT INTO {MIGRATIONS_TABLE} (name) VALUES (?)", (name,))
+
+        conn.execute(f"PRAGMA user_version = {version}")
+
+    if db_path == config.DB_PATH:
+        _initialized = True
@@ -2,8 +2,9 @@ import uuid
 from datetime import datetime
 
 from . import audit
-from .db import get_db, now_iso
+from .db import get_db, now_iso, prefix_bounds
 from .models import Draft
+from .policy import check_recipient_allowed
 
 
 def create_draft(
@@ -36,17 +37,17 @@ def create_draft(
                 from_addr,
             ),
         )
-
-    audit.log(
-        "create",
-        "draft",
-        draft_id,
-        {
-            "to": to_addr,
-            "subject": subject,
-            "auto_generated": claude_reasoning is not None,
-        },
-    )
+        audit.log(
+            "create",
+            "draft",
+            draft_id,
+            {
+                "to": to_addr,
+                "subject": subject,
+                "auto_generated": claude_reasoning is not None,
+            },
+            conn=conn,
+        )
 
     return draft_id
 
@@ -54,8 +55,8 @@ def create_draft(
 def resolve_draft_id(draft_id_prefix: str) -> str | None:
     with get_db() as conn:
         rows = conn.execute(
-            "SELECT id FROM drafts WHERE id LIKE ? ORDER BY created_at DESC",
-            (f"{draft_id_prefix}%",),
+            "SELECT id FROM drafts WHERE id >= ? AND id < ? LIMIT 2",
+            prefix_bounds(draft_id_prefix),
         ).fetchall()
 
     if len(rows) == 0:
@@ -69,68 +70,85 @@ def get_draft(draft_id: str) -> Draft | None:
     with get_db() as conn:
         row = conn.execute("SELECT * FROM drafts WHERE id = ?", (draft_id,)).fetchone()
 
-        if not row:
-            return None
-
-        row_dict = dict(row)
-        return Draft(
-            id=row_dict["id"],
-            thread_id=row_dict["thread_id"],
-            message_id=None,
-            to_addr=row_dict["to_addr"],
-            cc_addr=row_dict["cc_addr"],
-            subject=row_dict["subject"],
-            body=row_dict["body"],
-            claude_reasoning=row_dict["claude_reasoning"],
-            from_account_id=row_dict.get("from_account_id"),
-            from_addr=row_dict.get("from_addr"),
-            created_at=datetime.fromisoformat(row_dict["created_at"]),
-            approved_at=datetime.fromisoformat(row_dict["approved_at"])
-            if row_dict["approved_at"]
-            else None,
-            sent_at=datetime.fromisoformat(row_dict["sent_at"]) if row_dict["sent_at"] else None,
-        )
+    if not row:
+        return None
+
+    fromisoformat = datetime.fromisoformat
+    return Draft(
+        id=row["id"],
+        thread_id=row["thread_id"],
+        message_id=None,
+        to_addr=row["to_addr"],
+        cc_addr=row["cc_addr"],
+        subject=row["subject"],
+        body=row["body"],
+        claude_reasoning=row["claude_reasoning"],
+        from_account_id=row["from_account_id"],
+        from_addr=row["from_addr"],
+        created_at=fromisoformat(row["created_at"]),
+        approved_at=fromisoformat(row["approved_at"]) if row["approved_at"] else None,
+        sent_at=fromisoformat(row["sent_at"]) if row["sent_at"] else None,
+    )
 
 
-def approve_draft(draft_id: str) -> None:
+def approve_draft(draft_id: str) -> bool:
+    """Approve a pending draft; False if it was already approved. Raises if it doesn't exist."""
     with get_db() as conn:
-        conn.execute("UPDATE drafts SET approved_at = ? WHERE id = ?", (now_iso(), draft_id))
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            """
+            UPDATE drafts SET approved_at = ?
+            WHERE id = ? AND approved_at IS NULL AND sent_at IS NULL
+            RETURNING to_addr
+            """,
+            (now_iso(), draft_id),
+        ).fetchone()
+        if not row:
+            if conn.execute("SELECT 1 FROM drafts WHERE id = ?", (draft_id,)).fetchone():
+                return False
+            raise ValueError(f"Draft {draft_id} not found")
+
+        allowed, error_msg = check_recipient_allowed(row["to_addr"])
+        if not allowed:
+            raise ValueError(f"Cannot approve draft: {error_msg}")
 
-    audit.log("approve", "draft", draft_id)
+        audit.log("approve", "draft", draft_id, conn=conn)
+    return True
 
 
 def mark_sent(draft_id: str) -> None:
     with get_db() as conn:
         conn.execute("UPDATE drafts SET sent_at = ? WHERE id = ?", (now_iso(), draft_id))
-
-    audit.log("send", "draft", draft_id)
+        audit.log("send", "draft", draft_id, conn=conn)
 
 
 def list_pending_drafts() -> list[Draft]:
     with get_db() as conn:
         rows = conn.execute(
             """
-            SELECT * FROM drafts
+            SELECT id, thread_id, NULL, to_addr, cc_addr, subject, body, claude_reasoning,
+                   from_account_id, from_addr, created_at
+            FROM drafts
             WHERE approved_at IS NULL AND sent_at IS NULL
             ORDER BY created_at DESC
             """
         ).fetchall()
 
+    fromisoformat = datetime.fromisoformat
+    return [Draft(*row[:10], fromisoformat(row[10]), None, None) for row in rows]
+
+
+def list_pending_projected() -> list[tuple[str, str, str, bool]]:
+    with get_db() as conn:
         return [
-            Draft(
-                id=row["id"],
-                thread_id=row["thread_id"],
-                message_id=None,
-                to_addr=row["to_addr"],
-                cc_addr=row["cc_addr"],
-                subject=row["subject"],
-                body=row["body"],
-                claude_reasoning=row["claude_reasoning"],
-                from_account_id=dict(row).get("from_account_id"),
-                from_addr=dict(row).get("from_addr"),
-                created_at=datetime.fromisoformat(row["created_at"]),
-                approved_at=None,
-                sent_at=None,
+            tuple(row)
+            for row in conn.execute(
+                """
+                SELECT substr(id, 1, 8), to_addr, COALESCE(NULLIF(subject, ''), '(no subject)'),
+                       approved_at IS NOT NULL
+                FROM drafts
+                WHERE approved_at IS NULL AND sent_at IS NULL
+                ORDER BY created_at DESC
+                """
             )
-            for row in rows
         ]
@@ -1,4 +1,3 @@
-import json
 from dataclasses import dataclass
 from typing import Any
 
@@ -19,20 +18,26 @@ class ActionStats:
 
 def get_decision_stats() -> dict[str, ActionStats]:
     with get_db() as conn:
-        rows = conn.execute(
+        counts = conn.execute(
+            """
+            SELECT proposed_action, user_decision, COUNT(*)
+            FROM audit_log
+            WHERE action = 'decision' AND proposed_action IS NOT NULL
+            GROUP BY proposed_action, user_decision
+            """
+        ).fetchall()
+        correction_rows = conn.execute(
             """
-            SELECT proposed_action, user_decision, metadata
+            SELECT proposed_action, json_extract(metadata, '$.correction') AS correction
             FROM audit_log
             WHERE action = 'decision' AND proposed_action IS NOT NULL
+              AND user_decision = 'rejected_with_correction'
+              AND correction IS NOT NULL AND correction != ''
             """
         ).fetchall()
 
     stats: dict[str, dict[str, Any]] = {}
-    for row in rows:
-        action = row["proposed_action"]
-        decision = row["user_decision"]
-        metadata = json.loads(row["metadata"]) if row["metadata"] else {}
-
+    for action, decision, count in counts:
         if action not in stats:
             stats[action] = {
                 "total": 0,
@@ -42,15 +47,16 @@ def get_decision_stats() -> dict[str, ActionStats]:
                 "corrections": [],
             }
 
-        stats[action]["total"] += 1
+        stats[action]["total"] += count
         if decision == "approved":
-            stats[action]["approved"] += 1
+            stats[action]["approved"] += count
         elif decision == "rejected":
-            stats[action]["rejected"] += 1
+            stats[action]["rejected"] += count
         elif decision == "rejected_with_correction":
-            stats[action]["corrected"] += 1
-            if metadata.get("correction"):
-                stats[action]["corrections"].append((action, metadata["correction"]))
+            stats[action]["corrected"] += count
+
+    for action, correction in correction_rows:
+        stats[action]["corrections"].append((action, correction))
 
     result = {}
     for action, s in stats.items():
@@ -73,23 +79,20 @@ def get_correction_patterns() -> list[dict[str, Any]]:
     with get_db() as conn:
         rows = conn.execute(
             """
-            SELECT proposed_action, metadata
+            SELECT proposed_action, json_extract(metadata, '$.correction') AS correction,
+                   COUNT(*) AS count
             FROM audit_log
             WHERE action = 'decision' AND user_decision = 'rejected_with_correction'
+              AND correction IS NOT NULL AND correction != ''
+            GROUP BY proposed_action, correction
+            ORDER BY count DESC, MIN(rowid)
             """
         ).fetchall()
 
-    patterns: dict[tuple[str, str], int] = {}
-    for row in rows:
-        metadata = json.loads(row["metadata"]) if row["metadata"] else {}
-        if metadata.get("correction"):
-            key = (row["proposed_action"], metadata["correction"])
-            patterns[key] = patterns.get(key, 0) + 1
-
-    result = []
-    for (original, corrected), count in sorted(patterns.items(), key=lambda x: -x[1]):
-        result.append({"original": original, "corrected": corrected, "count": count})
-    return result
+    return [
+        {"original": original, "corrected": corrected, "count": count}
+        for original, corrected, count in rows
+    ]
 
 
 def suggest_auto_approve(threshold: float = 0.95, min_samples: int = 10) -> list[str]:
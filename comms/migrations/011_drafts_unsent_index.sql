@@ -0,0 +1,4 @@
+-- Unsent drafts: serves the dashboard's pending/approved counts and the newest-first
+-- pending listing.
+CREATE INDEX IF NOT EXISTS idx_drafts_unsent ON drafts(approved_at, sent_at, created_at)
+    WHERE sent_at IS NULL;
@@ -0,0 +1,4 @@
+-- Unread signal messages, newest first per account
+CREATE INDEX IF NOT EXISTS idx_signal_messages_unread
+    ON signal_messages(account_phone, timestamp DESC)
+    WHERE read_at IS NULL;
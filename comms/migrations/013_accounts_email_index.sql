@@ -0,0 +1,2 @@
+-- Lookup by email alone (UNIQUE(provider, email) leads with provider)
+CREATE INDEX IF NOT EXISTS idx_accounts_email ON accounts(email);
@@ -0,0 +1,2 @@
+-- Proposal listings filter by status and action together
+CREATE INDEX IF NOT EXISTS idx_proposals_status_action ON proposals(status, proposed_action);
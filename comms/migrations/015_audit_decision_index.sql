@@ -0,0 +1,2 @@
+-- Learning stats aggregate decisions by action and outcome
+CREATE INDEX IF NOT EXISTS idx_audit_decision ON audit_log(action, proposed_action, user_decision);
@@ -0,0 +1,8 @@
+-- Prior Claude triage decisions keyed by item signature, so recurring items skip the LLM
+CREATE TABLE IF NOT EXISTS triage_cache (
+    sig TEXT PRIMARY KEY,
+    action TEXT NOT NULL,
+    reasoning TEXT,
+    confidence REAL NOT NULL,
+    cached_at TEXT NOT NULL
+);
@@ -0,0 +1,2 @@
+-- Triage cache signature a proposal came from, so rejecting it forgets that decision
+ALTER TABLE proposals ADD COLUMN triage_sig TEXT;
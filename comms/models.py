@@ -56,3 +56,14 @@ class Draft:
     created_at: datetime
     approved_at: datetime | None
     sent_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class Proposal:
+    id: str
+    entity_type: str
+    entity_id: str
+    proposed_action: str
+    agent_reasoning: str | None
+    email: str | None
+    status: str
@@ -47,6 +47,16 @@ URGENCY_PATTERNS = [
 ]
 
 
+# One ordered alternation: the first branch that matches anywhere in the text wins,
+# preserving NOISE_PATTERNS precedence in a single regex call.
+_NOISE_RE = re.compile(
+    "^(?:" + "|".join(f"(?=.*?(?P<_{i}>{p}))" for i, (p, _, _) in enumerate(NOISE_PATTERNS)) + ")",
+    re.IGNORECASE | re.DOTALL,
+)
+_URGENCY = [(re.compile(p, re.IGNORECASE), score, reason) for p, score, reason in URGENCY_PATTERNS]
+_URGENCY_ANY = re.compile("|".join(f"(?:{p})" for p, _, _ in URGENCY_PATTERNS), re.IGNORECASE)
+
+
 @dataclass
 class PatternMatch:
     action: str
@@ -55,22 +65,25 @@ class PatternMatch:
 
 
 def match_noise(sender: str, subject: str, preview: str) -> PatternMatch | None:
-    text = f"{sender} {subject} {preview}".lower()
-
-    for pattern, action, reason in NOISE_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            return PatternMatch(action=action, reason=reason, confidence=0.95)
-
-    return None
+    m = _NOISE_RE.match(f"{sender} {subject} {preview}")
+    # Only the winning branch's lookahead participates, and its named group closes
+    # after any groups nested in the pattern, so lastgroup is "_<index>" of that branch.
+    if not m or m.lastgroup is None:
+        return None
+    _, action, reason = NOISE_PATTERNS[int(m.lastgroup[1:])]
+    return PatternMatch(action=action, reason=reason, confidence=0.95)
 
 
 def detect_urgency(subject: str, preview: str) -> tuple[float, str]:
     text = f"{subject} {preview}"
+    if not _URGENCY_ANY.search(text):
+        return 0.0, ""
+
     max_score = 0.0
     reasons = []
 
-    for pattern, score, reason in URGENCY_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
+    for pattern, score, reason in _URGENCY:
+        if pattern.search(text):
             if score > max_score:
                 max_score = score
             reasons.append(reason)
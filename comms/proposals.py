@@ -1,11 +1,16 @@
+import sqlite3
 import uuid
+from collections.abc import Callable
 from typing import Any
 
 from . import accounts as accts_module
-from . import audit, drafts, learning
+from . import audit, drafts, learning, triage_cache
 from .adapters.email import gmail
 from .adapters.messaging import signal
-from .db import get_db, now_iso
+from .db import get_db, now_iso, prefix_bounds
+from .models import Proposal
+
+PROPOSAL_COLUMNS = "id, entity_type, entity_id, proposed_action, agent_reasoning, email, status"
 
 VALID_ACTIONS = {
     "thread": {"archive", "delete", "flag", "unflag", "unarchive", "undelete"},
@@ -14,36 +19,91 @@ VALID_ACTIONS = {
 }
 
 
-def _validate_entity(entity_type: str, entity_id: str, email: str | None) -> tuple[bool, str]:
-    def validate_thread() -> bool:
-        acc = accts_module.select_email_account(email)[0]
-        if not acc:
-            return False
-        acc_email = acc.get("email") or email or ""
-        return bool(gmail.fetch_thread_messages(entity_id, acc_email))
-
-    validators = {
-        "thread": validate_thread,
-        "draft": lambda: drafts.get_draft(entity_id),
-        "signal_message": lambda: signal.get_message(entity_id),
-    }
-    if entity_type not in validators:
+def _validate_thread(entity_id: str, email: str | None) -> bool:
+    acc = accts_module.select_email_account(email)[0]
+    if not acc:
+        return False
+    acc_email = acc.get("email") or email or ""
+    return bool(gmail.fetch_thread_messages(entity_id, acc_email))
+
+
+def _validate_draft(entity_id: str, email: str | None) -> bool:
+    return drafts.get_draft(entity_id) is not None
+
+
+def _validate_signal_message(entity_id: str, email: str | None) -> bool:
+    return signal.get_message(entity_id) is not None
+
+
+_VALIDATORS: dict[str, tuple[Callable[[str, str | None], bool], set[str]]] = {
+    "thread": (_validate_thread, VALID_ACTIONS["thread"]),
+    "draft": (_validate_draft, VALID_ACTIONS["draft"]),
+    "signal_message": (_validate_signal_message, VALID_ACTIONS["signal_message"]),
+}
+
+
+def _validate(
+    entity_type: str, entity_id: str, proposed_action: str, email: str | None
+) -> tuple[bool, str]:
+    entry = _VALIDATORS.get(entity_type)
+    if entry is None:
         return False, f"Unknown entity_type: {entity_type}"
+    validator, valid_actions = entry
+    if proposed_action not in valid_actions:
+        return (
+            False,
+            f"Invalid action '{proposed_action}' for {entity_type}. Valid: {valid_actions}",
+        )
     try:
-        return (bool(validators[entity_type]()), "")
+        return validator(entity_id, email), ""
     except Exception as e:
         return False, f"Failed to validate {entity_type}: {e}"
 
 
-def _validate_action(entity_type: str, proposed_action: str) -> tuple[bool, str]:
-    if entity_type not in VALID_ACTIONS:
-        return False, f"Unknown entity_type: {entity_type}"
-    if proposed_action not in VALID_ACTIONS[entity_type]:
-        return (
-            False,
-            f"Invalid action '{proposed_action}' for {entity_type}. Valid: {VALID_ACTIONS[entity_type]}",
+def _insert_proposal(
+    conn: sqlite3.Connection,
+    entity_type: str,
+    entity_id: str,
+    proposed_action: str,
+    agent_reasoning: str | None,
+    email: str | None,
+    proposed_at: str,
+    auto_approved: bool,
+    triage_sig: str | None = None,
+) -> str:
+    proposal_id = str(uuid.uuid4())
+    conn.execute(
+        """
+        INSERT INTO proposals (id, entity_type, entity_id, proposed_action, agent_reasoning, email, proposed_at, status, approved_at, approved_by, triage_sig)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            proposal_id,
+            entity_type,
+            entity_id,
+            proposed_action,
+            agent_reasoning,
+            email,
+            proposed_at,
+            "approved" if auto_approved else "pending",
+            proposed_at if auto_approved else None,
+            "auto" if auto_approved else None,
+            triage_sig,
+        ),
+    )
+
+    if auto_approved:
+        audit.log_decision(
+            proposed_action=proposed_action,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            user_decision="auto_approved",
+            reasoning="Confidence threshold met",
+            metadata={"proposal_id": proposal_id, "agent_reasoning": agent_reasoning},
+            conn=conn,
         )
-    return True, ""
+
+    return proposal_id
 
 
 def create_proposal(
@@ -55,52 +115,69 @@ def create_proposal(
     skip_validation: bool = False,
 ) -> tuple[str | None, str, bool]:
     if not skip_validation:
-        valid_action, msg = _validate_action(entity_type, proposed_action)
-        if not valid_action:
-            return None, msg, False
-
-        valid_entity, msg = _validate_entity(entity_type, entity_id, email)
-        if not valid_entity:
+        valid, msg = _validate(entity_type, entity_id, proposed_action, email)
+        if not valid:
             return None, msg, False
 
     auto_approved = learning.should_auto_approve(proposed_action)
-    status = "approved" if auto_approved else "pending"
-
-    proposal_id = str(uuid.uuid4())
 
     with get_db() as conn:
-        conn.execute(
-            """
-            INSERT INTO proposals (id, entity_type, entity_id, proposed_action, agent_reasoning, email, proposed_at, status, approved_at, approved_by)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                proposal_id,
-                entity_type,
-                entity_id,
-                proposed_action,
-                agent_reasoning,
-                email,
-                now_iso(),
-                status,
-                now_iso() if auto_approved else None,
-                "auto" if auto_approved else None,
-            ),
-        )
-
-    if auto_approved:
-        audit.log_decision(
-            proposed_action=proposed_action,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            user_decision="auto_approved",
-            reasoning="Confidence threshold met",
-            metadata={"proposal_id": proposal_id, "agent_reasoning": agent_reasoning},
+        proposal_id = _insert_proposal(
+            conn,
+            entity_type,
+            entity_id,
+            proposed_action,
+            agent_reasoning,
+            email,
+            now_iso(),
+            auto_approved,
         )
 
     return proposal_id, "", auto_approved
 
 
+def create_proposals_bulk(rows: list[dict[str, Any]]) -> list[tuple[str | None, str, bool]]:
+    """create_proposal for many rows (same keyword fields) in one transaction."""
+    results: list[tuple[str | None, str, bool]] = []
+    pending: list[tuple[int, dict[str, Any], bool]] = []
+    auto_by_action: dict[str, bool] = {}
+
+    for row in rows:
+        if not row.get("skip_validation"):
+            valid, msg = _validate(
+                row["entity_type"], row["entity_id"], row["proposed_action"], row.get("email")
+            )
+            if not valid:
+                results.append((None, msg, False))
+                continue
+        action = row["proposed_action"]
+        if action not in auto_by_action:
+            auto_by_action[action] = learning.should_auto_approve(action)
+        pending.append((len(results), row, auto_by_action[action]))
+        results.append((None, "", False))
+
+    if not pending:
+        return results
+
+    proposed_at = now_iso()
+    with get_db() as conn:
+        for index, row, auto_approved in pending:
+            proposal_id = _insert_proposal(
+                conn,
+                row["entity_type"],
+                row["entity_id"],
+                row["proposed_action"],
+                row.get("agent_reasoning"),
+                row.get("email"),
+                proposed_at,
+                auto_approved,
+                row.get("triage_sig"),
+            )
+            results[index] = (proposal_id, "", auto_approved)
+
+    return results
+
+
 def get_proposal(proposal_id: str) -> dict[str, Any] | None:
     with get_db() as conn:
         row = conn.execute("SELECT * FROM proposals WHERE id = ?", (proposal_id,)).fetchone()
@@ -109,24 +186,28 @@ def get_proposal(proposal_id: str) -> dict[str, Any] | None:
         return dict(row)
 
 
-def list_proposals(status: str | None = None) -> list[dict[str, Any]]:
-    with get_db() as conn:
-        if status:
-            rows = conn.execute(
-                "SELECT * FROM proposals WHERE status = ? ORDER BY proposed_at DESC",
-                (status,),
-            ).fetchall()
-        else:
-            rows = conn.execute("SELECT * FROM proposals ORDER BY proposed_at DESC").fetchall()
+def list_proposals(status: str | None = None, action: str | None = None) -> list[Proposal]:
+    query = f"SELECT {PROPOSAL_COLUMNS} FROM proposals WHERE 1=1"
+    params = []
+
+    if status:
+        query += " AND status = ?"
+        params.append(status)
+    if action:
+        query += " AND proposed_action = ?"
+        params.append(action)
 
-        return [dict(row) for row in rows]
+    query += " ORDER BY proposed_at DESC"
+
+    with get_db() as conn:
+        return [Proposal(*row) for row in conn.execute(query, params)]
 
 
 def _resolve_proposal_id(proposal_id_prefix: str) -> str | None:
     with get_db() as conn:
         rows = conn.execute(
-            "SELECT id FROM proposals WHERE id LIKE ? ORDER BY proposed_at DESC",
-            (f"{proposal_id_prefix}%",),
+            "SELECT id FROM proposals WHERE id >= ? AND id < ? LIMIT 2",
+            prefix_bounds(proposal_id_prefix),
         ).fetchall()
 
         if len(rows) == 1:
@@ -134,35 +215,47 @@ def _resolve_proposal_id(proposal_id_prefix: str) -> str | None:
         return None
 
 
+def find_thread_ids(prefix: str, email: str | None = None, limit: int = 2) -> list[str]:
+    """Thread IDs seen in earlier proposals that start with prefix (index range scan)."""
+    lo, hi = prefix_bounds(prefix)
+    with get_db() as conn:
+        rows = conn.execute(
+            """
+            SELECT DISTINCT entity_id FROM proposals
+            WHERE entity_type = 'thread' AND entity_id >= ? AND entity_id < ?
+              AND (? IS NULL OR email IS NULL OR email = ?)
+            LIMIT ?
+            """,
+            (lo, hi, email, email, limit),
+        ).fetchall()
+    return [row["entity_id"] for row in rows]
+
+
 def approve_proposal(proposal_id: str, user_reasoning: str | None = None) -> bool:
     full_id = _resolve_proposal_id(proposal_id) or proposal_id
 
     with get_db() as conn:
-        row = conn.execute("SELECT * FROM proposals WHERE id = ?", (full_id,)).fetchone()
-        if not row:
-            return False
-
-        proposal = dict(row)
-        if proposal["status"] != "pending":
-            return False
-
-        conn.execute(
+        proposal = conn.execute(
             """
             UPDATE proposals
             SET status = 'approved', approved_at = ?, approved_by = 'user', user_reasoning = ?
-            WHERE id = ?
+            WHERE id = ? AND status = 'pending'
+            RETURNING entity_type, entity_id, proposed_action, agent_reasoning
             """,
             (now_iso(), user_reasoning, full_id),
-        )
+        ).fetchone()
+        if not proposal:
+            return False
 
-    audit.log_decision(
-        proposed_action=proposal["proposed_action"],
-        entity_type=proposal["entity_type"],
-        entity_id=proposal["entity_id"],
-        user_decision="approved",
-        reasoning=user_reasoning,
-        metadata={"proposal_id": proposal_id, "agent_reasoning": proposal["agent_reasoning"]},
-    )
+        audit.log_decision(
+            proposed_action=proposal["proposed_action"],
+            entity_type=proposal["entity_type"],
+            entity_id=proposal["entity_id"],
+            user_decision="approved",
+            reasoning=user_reasoning,
+            metadata={"proposal_id": proposal_id, "agent_reasoning": proposal["agent_reasoning"]},
+            conn=conn,
+        )
 
     return True
 
@@ -173,65 +266,75 @@ def reject_proposal(
     full_id = _resolve_proposal_id(proposal_id) or proposal_id
 
     with get_db() as conn:
-        row = conn.execute("SELECT * FROM proposals WHERE id = ?", (full_id,)).fetchone()
-        if not row:
-            return False
-
-        proposal = dict(row)
-        if proposal["status"] != "pending":
-            return False
-
-        conn.execute(
+        proposal = conn.execute(
             """
             UPDATE proposals
             SET status = 'rejected', rejected_at = ?, user_reasoning = ?, correction = ?
-            WHERE id = ?
+            WHERE id = ? AND status = 'pending'
+            RETURNING entity_type, entity_id, proposed_action, agent_reasoning, triage_sig
             """,
             (now_iso(), user_reasoning, correction, full_id),
-        )
-
-    decision_type = "rejected_with_correction" if correction else "rejected"
-    metadata = {
-        "proposal_id": proposal_id,
-        "agent_reasoning": proposal["agent_reasoning"],
-    }
-    if correction:
-        metadata["correction"] = correction
-
-    audit.log_decision(
-        proposed_action=proposal["proposed_action"],
-        entity_type=proposal["entity_type"],
-        entity_id=proposal["entity_id"],
-        user_decision=decision_type,
-        reasoning=user_reasoning,
-        metadata=metadata,
-    )
-
-    return True
-
+        ).fetchone()
+        if not proposal:
+            return False
 
-def mark_executed(proposal_id: str) -> bool:
-    with get_db() as conn:
-        conn.execute(
-            "UPDATE proposals SET status = 'executed', executed_at = ? WHERE id = ?",
-            (now_iso(), proposal_id),
-        )
+        decision_type = "rejected_with_correction" if correction else "rejected"
+        metadata = {
+            "proposal_id": proposal_id,
+            "agent_reasoning": proposal["agent_reasoning"],
+        }
+        if correction:
+            metadata["correction"] = correction
+        if proposal["triage_sig"]:
+            # Don't serve the rejected decision from the triage cache again.
+            triage_cache.forget(proposal["triage_sig"], conn=conn)
 
-    proposal = get_proposal(proposal_id)
-    if proposal:
-        audit.log(
-            action="execute",
+        audit.log_decision(
+            proposed_action=proposal["proposed_action"],
             entity_type=proposal["entity_type"],
             entity_id=proposal["entity_id"],
-            metadata={"proposal_id": proposal_id, "action": proposal["proposed_action"]},
+            user_decision=decision_type,
+            reasoning=user_reasoning,
+            metadata=metadata,
+            conn=conn,
         )
 
     return True
 
 
-def get_approved_proposals() -> list[dict[str, Any]]:
+def mark_executed(proposal_id: str) -> bool:
+    mark_executed_many([proposal_id])
+    return True
+
+
+def mark_executed_many(proposal_ids: list[str]) -> int:
+    if not proposal_ids:
+        return 0
+
+    placeholders = ", ".join("?" * len(proposal_ids))
     with get_db() as conn:
         rows = conn.execute(
-            "SELECT * FROM proposals WHERE status = 'approved' ORDER BY approved_at ASC"
+            f"""
+            UPDATE proposals SET status = 'executed', executed_at = ? WHERE id IN ({placeholders})
+            RETURNING id, entity_type, entity_id, proposed_action
+            """,
+            (now_iso(), *proposal_ids),
         ).fetchall()
-        return [dict(row) for row in rows]
+        for row in rows:
+            audit.log(
+                action="execute",
+                entity_type=row["entity_type"],
+                entity_id=row["entity_id"],
+                metadata={"proposal_id": row["id"], "action": row["proposed_action"]},
+                conn=conn,
+            )
+
+    return len(rows)
+
+
+def get_approved_proposals() -> list[Proposal]:
+    with get_db() as conn:
+        rows = conn.execute(
+            f"SELECT {PROPOSAL_COLUMNS} FROM proposals WHERE status = 'approved' ORDER BY approved_at ASC"
+        )
+        return [Proposal(*row) for row in rows]
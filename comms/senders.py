@@ -6,6 +6,7 @@ import hashlib
 import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
 from . import db
 
@@ -23,14 +24,19 @@ class SenderStat:
     priority_score: float
 
 
+_ANGLE_ADDR = re.compile(r"<([^>]+)>")
+
+
 def _normalize_sender(sender: str) -> str:
-    match = re.search(r"<([^>]+)>", sender)
+    match = _ANGLE_ADDR.search(sender)
     if match:
         return match.group(1).lower().strip()
     return sender.lower().strip()
 
 
+@lru_cache(maxsize=1024)
 def _sender_id(sender: str) -> str:
+    # Stored as the sender_stats primary key, so the digest itself can't change.
     normalized = _normalize_sender(sender)
     return hashlib.sha256(normalized.encode()).hexdigest()[:16]
 
@@ -41,25 +47,15 @@ def record_received(sender: str) -> None:
     now = datetime.now().isoformat()
 
     with db.get_db() as conn:
-        existing = conn.execute(
-            "SELECT id FROM sender_stats WHERE id = ?", (sender_hash,)
-        ).fetchone()
-
-        if existing:
-            conn.execute(
-                """UPDATE sender_stats
-                SET received_count = received_count + 1,
-                    last_received_at = ?,
-                    updated_at = ?
-                WHERE id = ?""",
-                (now, now, sender_hash),
-            )
-        else:
-            conn.execute(
-                """INSERT INTO sender_stats (id, sender, received_count, last_received_at, updated_at)
-                VALUES (?, ?, 1, ?, ?)""",
-                (sender_hash, normalized_sender, now, now),
-            )
+        conn.execute(
+            """INSERT INTO sender_stats (id, sender, received_count, last_received_at, updated_at)
+            VALUES (?, ?, 1, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                received_count = received_count + 1,
+                last_received_at = excluded.last_received_at,
+                updated_at = excluded.updated_at""",
+            (sender_hash, normalized_sender, now, now),
+        )
 
 
 def record_action(sender: str, action: str, response_hours: float | None = None) -> None:
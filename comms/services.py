@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+import heapq
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from . import accounts as accts_module
 from . import drafts, policy, proposals, senders
 from .adapters.email import gmail, outlook
 from .adapters.messaging import signal
+from .models import Proposal
 
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="comms-io")
 
-@dataclass(frozen=True)
+# Newest message time per (email, thread_id), as of the last listing this process saw.
+_last_message_at: dict[tuple[str, str], int] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class ProposalExecution:
     proposal_id: str
     action: str
@@ -26,12 +36,20 @@ def _resolve_email_account(email: str | None) -> dict[str, Any]:
     raise ValueError(error or "No email account found")
 
 
+_EMAIL_ADAPTERS = {"gmail": gmail, "outlook": outlook}
+
+_THREAD_ACTION_NAMES = ("archive", "delete", "flag", "unflag", "unarchive", "undelete")
+_THREAD_ACTION_FNS = {
+    provider: {action: getattr(adapter, f"{action}_thread") for action in _THREAD_ACTION_NAMES}
+    for provider, adapter in _EMAIL_ADAPTERS.items()
+}
+
+
 def _get_email_adapter(provider: str):
-    if provider == "gmail":
-        return gmail
-    if provider == "outlook":
-        return outlook
-    raise ValueError(f"Provider {provider} not supported")
+    adapter = _EMAIL_ADAPTERS.get(provider)
+    if adapter is None:
+        raise ValueError(f"Provider {provider} not supported")
+    return adapter
 
 
 def compose_email_draft(
@@ -99,10 +117,9 @@ def reply_to_thread(
     reply_all: bool = False,
 ) -> tuple[str, str, str, str | None]:
     account = _resolve_email_account(email)
-    adapter = _get_email_adapter(account["provider"])
     from_addr = account["email"]
 
-    messages = adapter.fetch_thread_messages(thread_id, from_addr)
+    messages = _fetch_thread_messages(account["provider"], thread_id, from_addr)
     if not messages:
         raise ValueError(f"Thread not found: {thread_id}")
 
@@ -150,25 +167,30 @@ def send_draft(draft_id: str) -> None:
         raise ValueError("Failed to send")
 
     drafts.mark_sent(draft_id)
+    if d.thread_id:
+        _last_message_at.pop((d.from_addr, d.thread_id), None)
 
     if d.to_addr:
         senders.record_action(d.to_addr, "reply")
 
 
-def list_threads(label: str) -> list[dict[str, Any]]:
+def _list_account_threads(account: dict[str, Any], label: str, limit: int) -> dict[str, Any] | None:
+    try:
+        adapter = _get_email_adapter(account["provider"])
+        threads = adapter.list_threads(account["email"], label=label, max_results=limit)
+    except ValueError:
+        return None
+    _record_last_message_at(account["email"], threads)
+    return {"account": account, "threads": threads}
+
+
+def list_threads(label: str, limit: int = 50) -> list[dict[str, Any]]:
     accounts = accts_module.list_accounts("email")
-    results = []
-    for account in accounts:
-        try:
-            adapter = _get_email_adapter(account["provider"])
-            threads = adapter.list_threads(account["email"], label=label)
-            results.append({"account": account, "threads": threads})
-        except ValueError:
-            continue
-    return results
+    results = _executor.map(lambda account: _list_account_threads(account, label, limit), accounts)
+    return [entry for entry in results if entry is not None]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InboxItem:
     source: str
     source_id: str
@@ -180,60 +202,88 @@ class InboxItem:
     item_id: str
 
 
+def _fetch_email_inbox(account: dict[str, Any], limit: int) -> list[InboxItem]:
+    try:
+        adapter = _get_email_adapter(account["provider"])
+        threads = adapter.list_threads(account["email"], label="inbox", max_results=limit)
+    except ValueError:
+        return []
+    _record_last_message_at(account["email"], threads)
+    return [
+        InboxItem(
+            source="email",
+            source_id=account["email"],
+            sender=t.get("from", "Unknown"),
+            subject=t.get("subject", ""),
+            preview=t.get("snippet", "")[:60],
+            timestamp=t.get("timestamp", 0),
+            unread="UNREAD" in t.get("labels", []),
+            item_id=t["id"],
+        )
+        for t in threads
+    ]
+
+
+def _fetch_signal_inbox(phone: str, limit: int) -> list[InboxItem]:
+    msgs = signal.get_messages(phone=phone, limit=limit, unread_only=False)
+    return [
+        InboxItem(
+            source="signal",
+            source_id=phone,
+            sender=m.get("sender_name") or m.get("sender_phone", "Unknown"),
+            subject="",
+            preview=m.get("body", "")[:60],
+            timestamp=m.get("timestamp", 0),
+            unread=m.get("read_at") is None,
+            item_id=m.get("id", ""),
+        )
+        for m in msgs
+    ]
+
+
 def get_unified_inbox(limit: int = 20) -> list[InboxItem]:
+    futures = [
+        _executor.submit(_fetch_email_inbox, account, limit)
+        for account in accts_module.list_accounts("email")
+    ]
+    futures += [
+        _executor.submit(_fetch_signal_inbox, phone, limit)
+        for phone in accts_module.list_signal_phones()
+    ]
+
+    # Collect in submission order; nlargest breaks ties by position, like a stable sort.
     items: list[InboxItem] = []
+    for future in futures:
+        items.extend(future.result())
+
+    return heapq.nlargest(limit, items, key=lambda x: x.timestamp)
 
-    email_accounts = accts_module.list_accounts("email")
-    for account in email_accounts:
-        try:
-            adapter = _get_email_adapter(account["provider"])
-            threads = adapter.list_threads(account["email"], label="inbox", max_results=limit)
-            items.extend(
-                [
-                    InboxItem(
-                        source="email",
-                        source_id=account["email"],
-                        sender=t.get("from", "Unknown"),
-                        subject=t.get("subject", ""),
-                        preview=t.get("snippet", "")[:60],
-                        timestamp=t.get("timestamp", 0),
-                        unread="UNREAD" in t.get("labels", []),
-                        item_id=t["id"],
-                    )
-                    for t in threads
-                ]
-            )
-        except ValueError:
-            continue
-
-    signal_accounts = accts_module.list_accounts("messaging")
-    for account in signal_accounts:
-        if account["provider"] == "signal":
-            msgs = signal.get_messages(phone=account["email"], limit=limit, unread_only=False)
-            items.extend(
-                [
-                    InboxItem(
-                        source="signal",
-                        source_id=account["email"],
-                        sender=m.get("sender_name") or m.get("sender_phone", "Unknown"),
-                        subject="",
-                        preview=m.get("body", "")[:60],
-                        timestamp=m.get("timestamp", 0),
-                        unread=m.get("read_at") is None,
-                        item_id=m.get("id", ""),
-                    )
-                    for m in msgs
-                ]
-            )
-
-    items.sort(key=lambda x: x.timestamp, reverse=True)
-    return items[:limit]
+
+def _record_last_message_at(email: str, threads: list[dict[str, Any]]) -> None:
+    # A newer timestamp changes the cache key below, so stale thread fetches stop hitting.
+    for thread in threads:
+        if thread.get("timestamp"):
+            _last_message_at[(email, thread["id"])] = thread["timestamp"]
+
+
+@lru_cache(maxsize=64)
+def _fetch_thread_cached(
+    thread_id: str, last_message_at: int, provider: str, email: str
+) -> tuple[dict[str, Any], ...]:
+    return tuple(_get_email_adapter(provider).fetch_thread_messages(thread_id, email))
+
+
+def _fetch_thread_messages(provider: str, thread_id: str, email: str) -> list[dict[str, Any]]:
+    last_message_at = _last_message_at.get((email, thread_id))
+    if last_message_at is None:
+        # Not seen in a listing yet, so there is nothing to tell a cached copy is current.
+        return _get_email_adapter(provider).fetch_thread_messages(thread_id, email)
+    return list(_fetch_thread_cached(thread_id, last_message_at, provider, email))
 
 
 def fetch_thread(thread_id: str, email: str | None) -> list[dict[str, Any]]:
     account = _resolve_email_account(email)
-    adapter = _get_email_adapter(account["provider"])
-    messages = adapter.fetch_thread_messages(thread_id, account["email"])
+    messages = _fetch_thread_messages(account["provider"], thread_id, account["email"])
     if not messages:
         raise ValueError(f"Thread not found: {thread_id}")
     return messages
@@ -245,18 +295,21 @@ def resolve_thread_id(prefix: str, email: str | None) -> str | None:
     if len(prefix) >= 16:
         return prefix
 
-    threads = adapter.list_threads(account["email"], label="inbox", max_results=100)
-    threads += adapter.list_threads(account["email"], label="unread", max_results=100)
-    for thread in threads:
-        if thread["id"].startswith(prefix):
-            return thread["id"]
+    known = proposals.find_thread_ids(prefix, account["email"])
+    if len(known) == 1:
+        return known[0]
+
+    thread_ids = adapter.list_thread_ids(account["email"], ["inbox", "unread"], max_results=100)
+    for thread_id in thread_ids:
+        if thread_id.startswith(prefix):
+            return thread_id
     return None
 
 
 def thread_action(action: str, thread_id: str, email: str | None) -> None:
     account = _resolve_email_account(email)
     adapter = _get_email_adapter(account["provider"])
-    action_fn = _get_thread_action(adapter, action)
+    action_fn = _THREAD_ACTION_FNS[account["provider"]].get(action)
     if not action_fn:
         raise ValueError(f"Unknown action: {action}")
 
@@ -277,62 +330,77 @@ def thread_action(action: str, thread_id: str, email: str | None) -> None:
         senders.record_action(sender, action)
 
 
-def _get_thread_action(adapter, action: str):
-    action_map = {
-        "archive": adapter.archive_thread,
-        "delete": adapter.delete_thread,
-        "flag": adapter.flag_thread,
-        "unflag": adapter.unflag_thread,
-        "unarchive": adapter.unarchive_thread,
-        "undelete": adapter.undelete_thread,
-    }
-    return action_map.get(action)
+def _execute_proposal(proposal: Proposal, default_email: str | None) -> ProposalExecution:
+    action = proposal.proposed_action
+    entity_type = proposal.entity_type
+    entity_id = proposal.entity_id
+    email = proposal.email or default_email
+
+    try:
+        if entity_type == "thread":
+            if not email:
+                email = _resolve_email_account(None)["email"]
+            thread_action(action, entity_id, email)
+        elif entity_type == "signal_message":
+            _execute_signal_action(action, entity_id)
+        else:
+            raise ValueError(f"Unknown entity type: {entity_type}")
+    except ValueError as exc:
+        return ProposalExecution(
+            proposal_id=proposal.id,
+            action=action,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            success=False,
+            error=str(exc),
+        )
+
+    return ProposalExecution(
+        proposal_id=proposal.id,
+        action=action,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        success=True,
+        error=None,
+    )
 
 
-def execute_approved_proposals() -> list[ProposalExecution]:
+def execute_approved_proposals() -> Iterator[ProposalExecution]:
     approved = proposals.get_approved_proposals()
-    results: list[ProposalExecution] = []
 
-    for proposal in approved:
-        action = proposal["proposed_action"]
-        entity_type = proposal["entity_type"]
-        entity_id = proposal["entity_id"]
-        email = proposal.get("email")
+    default_email = None
+    if any(p.entity_type == "thread" and not p.email for p in approved):
+        # Resolve once; if it fails, each affected proposal re-raises and reports it.
+        account, _ = accts_module.select_email_account(None)
+        default_email = account["email"] if account else None
 
-        try:
-            if entity_type == "thread":
-                if not email:
-                    account = _resolve_email_account(None)
-                    email = account["email"]
-                thread_action(action, entity_id, email)
-            elif entity_type == "signal_message":
-                _execute_signal_action(action, entity_id)
-            else:
-                raise ValueError(f"Unknown entity type: {entity_type}")
-            proposals.mark_executed(proposal["id"])
-            results.append(
-                ProposalExecution(
-                    proposal_id=proposal["id"],
-                    action=action,
-                    entity_type=entity_type,
-                    entity_id=entity_id,
-                    success=True,
-                    error=None,
-                )
-            )
-        except ValueError as exc:
-            results.append(
-                ProposalExecution(
-                    proposal_id=proposal["id"],
-                    action=action,
-                    entity_type=entity_type,
-                    entity_id=entity_id,
-                    success=False,
-                    error=str(exc),
-                )
-            )
-
-    return results
+    # Actions on the same entity run in approved_at order on one worker.
+    by_entity: dict[tuple[str, str], list[Proposal]] = {}
+    for proposal in approved:
+        by_entity.setdefault((proposal.entity_type, proposal.entity_id), []).append(proposal)
+
+    futures = [
+        _executor.submit(_execute_in_order, batch, default_email) for batch in by_entity.values()
+    ]
+    try:
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        # Submitted actions run even if the caller stops early, so record all of them.
+        wait(futures)
+        proposals.mark_executed_many(
+            [
+                result.proposal_id
+                for future in futures
+                if future.exception() is None
+                for result in future.result()
+                if result.success
+            ]
+        )
+
+
+def _execute_in_order(batch: list[Proposal], default_email: str | None) -> list[ProposalExecution]:
+    return [_execute_proposal(proposal, default_email) for proposal in batch]
 
 
 def _execute_signal_action(action: str, message_id: str) -> None:
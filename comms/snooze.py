@@ -8,6 +8,8 @@ from typing import Any
 
 from . import db
 
+SQL_VARIABLE_CHUNK = 900
+
 
 def parse_until(until: str) -> datetime:
     now = datetime.now()
@@ -100,6 +102,17 @@ def mark_resurfaced(snooze_id: str) -> bool:
         return result.rowcount > 0
 
 
+def resurface_due() -> int:
+    now = datetime.now().isoformat()
+
+    with db.get_db() as conn:
+        result = conn.execute(
+            "UPDATE snoozed_items SET resurfaced_at = ? WHERE snooze_until <= ? AND resurfaced_at IS NULL",
+            (now, now),
+        )
+        return result.rowcount
+
+
 def get_snoozed_items() -> list[dict[str, Any]]:
     now = datetime.now().isoformat()
 
@@ -135,3 +148,26 @@ def is_snoozed(entity_type: str, entity_id: str) -> bool:
         ).fetchone()
 
     return row is not None
+
+
+def get_snoozed_ids(keys: list[tuple[str, str]]) -> set[tuple[str, str]]:
+    """The (entity_type, entity_id) pairs among keys that are currently snoozed."""
+    now = datetime.now().isoformat()
+    wanted = set(keys)
+    types = sorted({entity_type for entity_type, _ in wanted})
+    ids = sorted({entity_id for _, entity_id in wanted})
+    snoozed: set[tuple[str, str]] = set()
+
+    with db.get_db() as conn:
+        for start in range(0, len(ids), SQL_VARIABLE_CHUNK):
+            chunk = ids[start : start + SQL_VARIABLE_CHUNK]
+            rows = conn.execute(
+                f"""SELECT entity_type, entity_id FROM snoozed_items
+                WHERE entity_type IN ({", ".join("?" * len(types))})
+                AND entity_id IN ({", ".join("?" * len(chunk))})
+                AND snooze_until > ? AND resurfaced_at IS NULL""",
+                (*types, *chunk, now),
+            ).fetchall()
+            snoozed.update((row[0], row[1]) for row in rows)
+
+    return snoozed & wanted
@@ -3,56 +3,37 @@
 from __future__ import annotations
 
 import json
-import subprocess
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, replace
+from typing import Any
 
 from . import proposals as proposals_module
-from .config import RULES_PATH
-from .contacts import format_contacts_for_prompt, get_high_priority_patterns
+from . import triage_cache
+from .claude import api_available, cli_available, run_claude, stream_message
+from .config import load_rules
+from .contacts import format_contacts_for_prompt, is_high_priority
 from .patterns import detect_urgency, should_skip_triage
 from .senders import format_sender_context_for_prompt
 from .services import InboxItem, get_unified_inbox
-from .snooze import get_due_snoozes, is_snoozed, mark_resurfaced
+from .snooze import get_snoozed_ids, resurface_due
 
+_json_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_json_loads = json.JSONDecoder().decode
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TriageProposal:
     item: InboxItem
     action: str
     reasoning: str
     confidence: float
+    # Triage cache signature, when the decision came from Claude or the cache.
+    sig: str | None = None
 
 
-def _load_rules() -> str:
-    if RULES_PATH.exists():
-        return RULES_PATH.read_text()
-    return ""
-
-
-def _build_prompt(items: list[InboxItem], rules: str) -> str:
-    items_json = []
-    sender_histories = []
-
-    for item in items:
-        item_data = {
-            "id": item.item_id[:8],
-            "source": item.source,
-            "sender": item.sender,
-            "subject": item.subject,
-            "preview": item.preview,
-            "unread": item.unread,
-        }
-
-        sender_ctx = format_sender_context_for_prompt(item.sender)
-        if sender_ctx:
-            sender_histories.append(sender_ctx)
-
-        items_json.append(item_data)
-
-    contacts = format_contacts_for_prompt()
-    histories = "\n\n".join(sender_histories) if sender_histories else ""
-
-    return f"""You are triaging a communications inbox for someone with ADHD. Analyze each item and propose an action.
+# Invariant prompt sections; the system prompt stays byte-identical while rules and
+# contacts are unchanged, so the API path can cache it as a prompt prefix.
+_PREAMBLE = """You are triaging a communications inbox for someone with ADHD. Analyze each item and propose an action.
 
 STEWARD CONTEXT:
 - High-priority contacts (flag always, never auto-archive): people in personal life, close relationships
@@ -60,56 +41,158 @@ STEWARD CONTEXT:
 - Default bias: delete noise aggressively, flag anything requiring a human decision
 
 RULES (user preferences):
-{rules or "No rules configured. Use sensible defaults."}
-
-{contacts}
-
-{histories}
+"""
+_DEFAULT_RULES = "No rules configured. Use sensible defaults."
+_OUTPUT_SPEC = """
 
 VALID ACTIONS:
 - For email: archive, delete, flag, ignore
 - For signal: mark_read, flag, ignore
 
-OUTPUT FORMAT (JSON array, one object per item):
-[
-  {{"id": "abc123", "action": "archive", "reasoning": "Newsletter, no response needed", "confidence": 0.9}},
-  ...
-]
-
-ITEMS TO TRIAGE:
-{json.dumps(items_json, indent=2)}
+Propose exactly one action per item, with brief reasoning and a confidence from 0 to 1."""
+_TRIAGE_TOOL = {
+    "name": "submit_triage",
+    "description": "Submit one proposed action per inbox item.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "proposals": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string"},
+                        "action": {
+                            "type": "string",
+                            "enum": ["archive", "delete", "flag", "ignore", "mark_read"],
+                        },
+                        "reasoning": {"type": "string"},
+                        "confidence": {"type": "number"},
+                    },
+                    "required": ["id", "action", "confidence"],
+                },
+            }
+        },
+        "required": ["proposals"],
+    },
+}
+_ITEMS_HEADER = "\n\nITEMS TO TRIAGE:\n"
+# The API path forces the submit_triage tool; only the CLI needs the format spelled out.
+_CLI_OUTPUT_FORMAT = """
+
+OUTPUT FORMAT (compact JSON array, one object per item):
+[{"id":"abc123","action":"archive","reasoning":"Newsletter, no response needed","confidence":0.9},...]
 
 Respond with ONLY the JSON array. No explanation."""
 
 
+def _build_system_prompt(rules: str) -> str:
+    return "".join(
+        (_PREAMBLE, rules or _DEFAULT_RULES, "\n\n", format_contacts_for_prompt(), _OUTPUT_SPEC)
+    )
+
+
+def _id_prefix_len(items: list[InboxItem], start: int = 4) -> int:
+    """Shortest id prefix (at least `start`) that is unique across items — fewer tokens each way."""
+    longest = max((len(item.item_id) for item in items), default=start)
+    for n in range(start, longest):
+        if len({item.item_id[:n] for item in items}) == len(items):
+            return n
+    return longest
+
+
+def _build_user_message(items: list[InboxItem]) -> str:
+    # One history lookup (and prompt block) per distinct sender, in first-seen order.
+    unique_senders = dict.fromkeys(item.sender for item in items)
+    sender_histories = [ctx for ctx in map(format_sender_context_for_prompt, unique_senders) if ctx]
+
+    n = _id_prefix_len(items)
+    items_json = [
+        {
+            "id": item.item_id[:n],
+            "source": item.source,
+            "sender": item.sender,
+            "subject": item.subject,
+            "preview": item.preview,
+            "unread": item.unread,
+        }
+        for item in items
+    ]
+
+    return "".join(("\n\n".join(sender_histories), _ITEMS_HEADER, _json_dumps(items_json)))
+
+
 def _parse_response(output: str, items: list[InboxItem]) -> list[TriageProposal]:
-    output = output.strip()
-    if output.startswith("```"):
-        lines = output.split("\n")
-        output = "\n".join(lines[1:-1] if lines[-1] == "```" else lines[1:])
+    # Parse only the outermost [...] so fences and chatty preamble don't fail the whole reply.
+    start = output.find("[")
+    end = output.rfind("]")
+    payload = output[start : end + 1] if start != -1 and end > start else output
 
     try:
-        proposals_data = json.loads(output)
+        proposals_data = _json_loads(payload)
     except json.JSONDecodeError:
+        # Malformed or truncated array: salvage whichever objects are complete.
+        proposals_data = list(_iter_json_objects([payload]))
+    if not isinstance(proposals_data, list):
         return []
 
-    item_map = {item.item_id[:8]: item for item in items}
-    proposals = []
+    return list(_to_proposals(proposals_data, items))
+
+
+def _to_proposals(
+    proposals_data: Iterable[Any], items: list[InboxItem]
+) -> Iterator[TriageProposal]:
+    n = _id_prefix_len(items)
+    item_map = {item.item_id[:n]: item for item in items}
 
     for proposal_data in proposals_data:
+        if not isinstance(proposal_data, dict):
+            continue
         item_id = proposal_data.get("id", "")
         if item_id not in item_map:
             continue
-        proposals.append(
-            TriageProposal(
-                item=item_map[item_id],
-                action=proposal_data.get("action", "ignore"),
-                reasoning=proposal_data.get("reasoning", ""),
-                confidence=float(proposal_data.get("confidence", 0.5)),
-            )
+        yield TriageProposal(
+            item=item_map[item_id],
+            action=proposal_data.get("action", "ignore"),
+            reasoning=proposal_data.get("reasoning", ""),
+            confidence=float(proposal_data.get("confidence", 0.5)),
         )
 
-    return proposals
+
+def _iter_json_objects(chunks: Iterable[str], nested: int = 0) -> Iterator[Any]:
+    """Yield each {...} opened at object depth `nested` in streamed text as soon as it closes.
+
+    Text outside objects (array brackets, fences, stray prose) is skipped. nested=1 reads
+    the elements of an array held inside a wrapper object, e.g. a tool call's input.
+    """
+    buf: list[str] = []
+    depth = 0
+    in_string = escaped = False
+
+    for chunk in chunks:
+        for ch in chunk:
+            if depth > nested:
+                buf.append(ch)
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = depth > 0
+            elif ch == "{":
+                if depth == nested:
+                    buf = ["{"]
+                depth += 1
+            elif ch == "}" and depth:
+                depth -= 1
+                if depth == nested:
+                    try:
+                        yield _json_loads("".join(buf))
+                    except json.JSONDecodeError:
+                        continue
 
 
 def _apply_patterns(items: list[InboxItem]) -> tuple[list[TriageProposal], list[InboxItem]]:
@@ -152,95 +235,149 @@ def triage_inbox(
     limit: int = 20,
     model: str = "claude-sonnet-4-20250514",
 ) -> list[TriageProposal]:
+    return list(iter_triage(limit=limit, model=model))
+
+
+def iter_triage(
+    limit: int = 20,
+    model: str = "claude-sonnet-4-20250514",
+) -> Iterator[TriageProposal]:
+    """Yield pattern-matched proposals immediately, then Claude's once it answers."""
     items = get_unified_inbox(limit=limit)
     if not items:
-        return []
+        return
 
-    due_snoozes = get_due_snoozes()
-    for snooze in due_snoozes:
-        mark_resurfaced(snooze["id"])
+    resurface_due()
 
     entity_type_map = {"email": "thread", "signal": "signal_message"}
-    items = [
-        item
-        for item in items
-        if not is_snoozed(entity_type_map.get(item.source, "thread"), item.item_id)
-    ]
+    keys = [(entity_type_map.get(item.source, "thread"), item.item_id) for item in items]
+    snoozed = get_snoozed_ids(keys)
+    items = [item for item, key in zip(items, keys, strict=True) if key not in snoozed]
+
+    yield from iter_triage_items(items, model=model)
 
+
+def iter_triage_items(
+    items: list[InboxItem],
+    model: str = "claude-sonnet-4-20250514",
+) -> Iterator[TriageProposal]:
+    """Triage an arbitrary item list with at most one Claude call.
+
+    Callers triaging several sources at once should pass the union here rather than
+    calling once per source, so the preamble and round-trip are paid once.
+    """
     if not items:
-        return []
+        return
 
     pattern_proposals, remaining = _apply_patterns(items)
+    yield from pattern_proposals
+
+    # High-priority contacts are always flagged, whatever Claude says, so don't ask.
+    routed, remaining = _route_local(remaining)
+    yield from routed
 
     if not remaining:
-        return pattern_proposals
+        return
 
-    rules = _load_rules()
-    prompt = _build_prompt(remaining, rules)
+    system = _build_system_prompt(load_rules())
+    context = triage_cache.context_hash(system)
+    sigs = {
+        item.item_id: triage_cache.signature(
+            item.source, item.sender, item.subject, item.preview, context
+        )
+        for item in remaining
+    }
+    cached = triage_cache.get_many(list(sigs.values()))
+    # Identical deliveries share a signature; Claude sees one per group and the answer fans out.
+    groups: dict[str, list[InboxItem]] = {}
+    for item in remaining:
+        sig = sigs[item.item_id]
+        hit = cached.get(sig)
+        if hit:
+            action, reasoning, confidence = hit
+            yield _apply_overrides(
+                TriageProposal(item, action, f"[cached] {reasoning}", confidence, sig)
+            )
+        else:
+            groups.setdefault(sig, []).append(item)
 
-    result = subprocess.run(
-        [
-            "claude",
-            "--print",
-            "--model",
-            model,
-            "-p",
-            prompt,
-            "--dangerously-skip-permissions",
-        ],
-        capture_output=True,
-        text=True,
-        timeout=120,
-    )
+    if not groups:
+        return
+
+    to_ask = [members[0] for members in groups.values()]
 
-    if result.returncode != 0:
-        return pattern_proposals
+    user = _build_user_message(to_ask)
 
-    claude_proposals = _parse_response(result.stdout, remaining)
-    high_priority = get_high_priority_patterns()
+    if api_available():
+        # Proposals are yielded as each object closes, while the model is still generating.
+        # The forced tool call streams its input as {"proposals": [...]}.
+        stream = stream_message(system, user, model, timeout=120, tool=_TRIAGE_TOOL)
+        claude_proposals = _to_proposals(_iter_json_objects(stream, nested=1), to_ask)
+    elif cli_available():
+        result = run_claude(f"{system}\n\n{user}{_CLI_OUTPUT_FORMAT}", model, timeout=120)
+        if result.returncode != 0:
+            return
+        claude_proposals = iter(_parse_response(result.stdout, to_ask))
+    else:
+        return
 
+    answered = []
     for p in claude_proposals:
-        urgency, urgency_reason = detect_urgency(p.item.subject, p.item.preview)
-        if urgency >= 0.6 and p.action not in ("flag", "delete"):
-            p.reasoning += f" [urgent: {urgency_reason}]"
+        sig = sigs[p.item.item_id]
+        answered.append((sig, p.action, p.reasoning, p.confidence))
+        for member in groups[sig]:
+            yield _apply_overrides(replace(p, item=member, sig=sig))
+
+    triage_cache.store_many(answered)
+
+
+def _route_local(items: list[InboxItem]) -> tuple[list[TriageProposal], list[InboxItem]]:
+    routed = []
+    remaining = []
+    for item in items:
+        if is_high_priority(item.sender):
+            routed.append(
+                TriageProposal(item, "flag", "[steward] high-priority contact", confidence=1.0)
+            )
+        else:
+            remaining.append(item)
+    return routed, remaining
 
-        sender_lower = p.item.sender.lower()
-        if any(pat in sender_lower for pat in high_priority) and p.action not in ("flag",):
-            p.action = "flag"
-            p.reasoning = f"[steward] high-priority contact — {p.reasoning}"
-            p.confidence = 1.0
 
-    return pattern_proposals + claude_proposals
+def _apply_overrides(p: TriageProposal) -> TriageProposal:
+    urgency, urgency_reason = detect_urgency(p.item.subject, p.item.preview)
+    if urgency >= 0.6 and p.action not in ("flag", "delete"):
+        return replace(p, reasoning=f"{p.reasoning} [urgent: {urgency_reason}]")
+    return p
 
 
 def create_proposals_from_triage(
-    proposals: list[TriageProposal],
+    proposals: Iterable[TriageProposal],
     min_confidence: float = 0.7,
     dry_run: bool = False,
 ) -> list[tuple[str, TriageProposal]]:
-    created = []
-    for p in proposals:
-        if p.confidence < min_confidence:
-            continue
-        if p.action == "ignore":
-            continue
+    selected = [p for p in proposals if p.confidence >= min_confidence and p.action != "ignore"]
 
-        entity_type = "thread" if p.item.source == "email" else "signal_message"
+    if dry_run:
+        return [("dry-run", p) for p in selected]
 
-        if dry_run:
-            created.append(("dry-run", p))
-            continue
-
-        proposal_id, _, _ = proposals_module.create_proposal(
-            entity_type=entity_type,
-            entity_id=p.item.item_id,
-            proposed_action=p.action,
-            agent_reasoning=p.reasoning,
-            email=p.item.source_id if p.item.source == "email" else None,
-            skip_validation=True,
-        )
-
-        if proposal_id:
-            created.append((proposal_id, p))
+    results = proposals_module.create_proposals_bulk(
+        [
+            {
+                "entity_type": "thread" if p.item.source == "email" else "signal_message",
+                "entity_id": p.item.item_id,
+                "proposed_action": p.action,
+                "agent_reasoning": p.reasoning,
+                "email": p.item.source_id if p.item.source == "email" else None,
+                "triage_sig": p.sig,
+                "skip_validation": True,
+            }
+            for p in selected
+        ]
+    )
 
-    return created
+    return [
+        (proposal_id, p)
+        for (proposal_id, _, _), p in zip(results, selected, strict=True)
+        if proposal_id
+    ]
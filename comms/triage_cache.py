@@ -0,0 +1,66 @@
+"""Remembered triage decisions — recurring items skip the LLM."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from datetime import datetime, timedelta
+
+from . import db
+
+TRIAGE_CACHE_TTL = timedelta(days=7)
+SQL_VARIABLE_CHUNK = 900
+
+
+def context_hash(system_prompt: str) -> str:
+    return hashlib.blake2b(system_prompt.encode(), digest_size=8).hexdigest()
+
+
+def signature(source: str, sender: str, subject: str, preview: str, context: str = "") -> str:
+    """Item key; `context` (a hash of the system prompt) makes rule or contact edits miss."""
+    key = f"{context}|{source}|{sender.lower()}|{subject}|{preview[:200]}"
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def get_many(sigs: list[str]) -> dict[str, tuple[str, str, float]]:
+    cutoff = (datetime.now() - TRIAGE_CACHE_TTL).isoformat(timespec="seconds")
+    hits: dict[str, tuple[str, str, float]] = {}
+
+    with db.get_db() as conn:
+        for start in range(0, len(sigs), SQL_VARIABLE_CHUNK):
+            chunk = sigs[start : start + SQL_VARIABLE_CHUNK]
+            rows = conn.execute(
+                f"""SELECT sig, action, reasoning, confidence FROM triage_cache
+                WHERE sig IN ({", ".join("?" * len(chunk))}) AND cached_at >= ?""",
+                (*chunk, cutoff),
+            ).fetchall()
+            for row in rows:
+                hits[row["sig"]] = (row["action"], row["reasoning"] or "", row["confidence"])
+
+    return hits
+
+
+def store_many(entries: list[tuple[str, str, str, float]]) -> None:
+    """Store (sig, action, reasoning, confidence) rows and drop expired ones."""
+    if not entries:
+        return
+    now = db.now_iso()
+    cutoff = (datetime.now() - TRIAGE_CACHE_TTL).isoformat(timespec="seconds")
+
+    with db.get_db() as conn:
+        conn.execute("DELETE FROM triage_cache WHERE cached_at < ?", (cutoff,))
+        conn.executemany(
+            """INSERT OR REPLACE INTO triage_cache (sig, action, reasoning, confidence, cached_at)
+            VALUES (?, ?, ?, ?, ?)""",
+            [(*entry, now) for entry in entries],
+        )
+
+
+def forget(sig: str, conn: sqlite3.Connection | None = None) -> None:
+    """Drop one remembered decision; pass `conn` to commit with the caller's write."""
+    if conn is not None:
+        conn.execute("DELETE FROM triage_cache WHERE sig = ?", (sig,))
+        return
+
+    with db.get_db() as conn:
+        conn.execute("DELETE FROM triage_cache WHERE sig = ?", (sig,))
@@ -1,12 +1,41 @@
+import sqlite3
+import subprocess
+from types import SimpleNamespace
+
 import pytest
 
 from comms import config as comms_config
-from comms import db, drafts, policy
+from comms import (
+    contacts,
+    daemon,
+    db,
+    drafts,
+    learning,
+    patterns,
+    policy,
+    proposals,
+    services,
+    triage,
+    triage_cache,
+)
+from comms.adapters.messaging import signal as signal_adapter
+from comms.services import InboxItem
+
+
+@pytest.fixture(scope="session")
+def template_db(tmp_path_factory):
+    template = tmp_path_factory.mktemp("template") / "template.db"
+    db.init(template)
+    return template
 
 
 @pytest.fixture()
-def initialized_db(tmp_path, monkeypatch):
+def initialized_db(template_db, tmp_path, monkeypatch):
     db_path = tmp_path / "test.db"
+    src, dst = sqlite3.connect(template_db), sqlite3.connect(db_path)
+    src.backup(dst)
+    dst.close()
+    src.close()
     monkeypatch.setattr(comms_config, "DB_PATH", db_path)
     monkeypatch.setattr(comms_config, "BACKUP_DIR", tmp_path / "backups")
     db.init(db_path)
@@ -48,6 +77,46 @@ def test_resolve_draft_id_prefix(initialized_db):
     assert drafts.resolve_draft_id("zzzzzzzz") is None
 
 
+def test_approve_draft_rejects_blocked_recipient(initialized_db, monkeypatch):
+    draft_id = drafts.create_draft(
+        to_addr="person@example.com",
+        subject="hello",
+        body="body",
+    )
+
+    monkeypatch.setattr(
+        policy,
+        "get_policy",
+        lambda: {
+            "allowed_recipients": ["allowed@example.com"],
+            "allowed_domains": [],
+        },
+    )
+
+    with pytest.raises(ValueError, match="not in allowlist"):
+        drafts.approve_draft(draft_id)
+
+    draft = drafts.get_draft(draft_id)
+    assert draft is not None
+    assert draft.approved_at is None
+
+
+def test_approve_draft_twice(initialized_db):
+    draft_id = drafts.create_draft(
+        to_addr="person@example.com",
+        subject="hello",
+        body="body",
+    )
+
+    assert drafts.approve_draft(draft_id) is True
+    assert drafts.approve_draft(draft_id) is False
+
+
+def test_approve_draft_not_found(initialized_db):
+    with pytest.raises(ValueError, match="not found"):
+        drafts.approve_draft("missing")
+
+
 def test_validate_send_requires_approval(initialized_db, monkeypatch):
     draft_id = drafts.create_draft(
         to_addr="person@example.com",
@@ -122,3 +191,239 @@ def test_validate_send_daily_limit(initialized_db, monkeypatch):
     ok, errors = policy.validate_send(draft_id, "person@example.com")
     assert not ok
     assert errors and errors[0].startswith("daily send limit reached")
+
+
+def test_list_proposals_filters_by_action(initialized_db):
+    for action in ("archive", "archive", "delete"):
+        proposals.create_proposal("thread", f"thread-{action}", action, skip_validation=True)
+
+    archived = proposals.list_proposals(status="pending", action="archive")
+    assert len(archived) == 2
+    assert {p.proposed_action for p in archived} == {"archive"}
+    assert len(proposals.list_proposals(status="pending")) == 3
+
+
+def test_create_proposals_bulk_keeps_row_order(initialized_db):
+    rows = [
+        {
+            "entity_type": "thread",
+            "entity_id": f"thread-{action}",
+            "proposed_action": action,
+            "skip_validation": True,
+        }
+        for action in ("archive", "delete", "flag")
+    ]
+    results = proposals.create_proposals_bulk(rows)
+
+    assert [auto for _, _, auto in results] == [False, False, False]
+    stored = {p.id: p.proposed_action for p in proposals.list_proposals(status="pending")}
+    assert [stored[proposal_id] for proposal_id, _, _ in results] == ["archive", "delete", "flag"]
+
+
+def test_reject_proposal_logs_correction_once(initialized_db):
+    proposal_id, _, _ = proposals.create_proposal(
+        "thread", "thread-1", "archive", skip_validation=True
+    )
+
+    assert proposals.reject_proposal(proposal_id, correction="delete")
+    assert not proposals.reject_proposal(proposal_id, correction="delete")
+    assert not proposals.approve_proposal(proposal_id)
+
+    stats = learning.get_decision_stats()["archive"]
+    assert stats.corrected == 1
+    assert stats.corrections == [("archive", "delete")]
+
+
+def test_thread_fetch_cached_until_newer_message(monkeypatch):
+    fetches = []
+    listing = [{"id": "t1", "timestamp": 100}]
+
+    def fetch_thread_messages(thread_id, email):
+        fetches.append(thread_id)
+        return [{"from": "ann@x.com", "subject": "Hi"}]
+
+    adapter = SimpleNamespace(
+        list_threads=lambda email, label, max_results: listing,
+        fetch_thread_messages=fetch_thread_messages,
+    )
+    monkeypatch.setitem(services._EMAIL_ADAPTERS, "gmail", adapter)
+    monkeypatch.setattr(services, "_last_message_at", {})
+    monkeypatch.setattr(
+        services, "_resolve_email_account", lambda email: {"provider": "gmail", "email": "me@x.com"}
+    )
+    services._fetch_thread_cached.cache_clear()
+    account = {"provider": "gmail", "email": "me@x.com"}
+
+    services.fetch_thread("t1", None)
+    assert len(fetches) == 1  # not listed yet: always fetched
+
+    services._fetch_email_inbox(account, 10)
+    services.fetch_thread("t1", None)
+    services.fetch_thread("t1", None)
+    assert len(fetches) == 2
+
+    listing[0] = {"id": "t1", "timestamp": 200}
+    services._fetch_email_inbox(account, 10)
+    services.fetch_thread("t1", None)
+    assert len(fetches) == 3
+
+
+def test_triage_cache_round_trip(initialized_db):
+    sig = triage_cache.signature("email", "Bob@Example.com", "Weekly", "preview")
+    assert sig == triage_cache.signature("email", "bob@example.com", "Weekly", "preview")
+    assert triage_cache.get_many([sig]) == {}
+
+    triage_cache.store_many([(sig, "archive", "newsletter", 0.9)])
+    assert triage_cache.get_many([sig, "missing"]) == {sig: ("archive", "newsletter", 0.9)}
+
+
+def test_triage_cache_misses_after_rules_change(initialized_db, monkeypatch):
+    calls = []
+
+    def fake_claude(prompt, model, timeout):
+        calls.append(prompt)
+        reply = '[{"id": "item", "action": "archive", "reasoning": "r", "confidence": 0.9}]'
+        return subprocess.CompletedProcess([], 0, stdout=reply, stderr="")
+
+    rules = ["Archive newsletters."]
+    monkeypatch.setattr(triage, "load_rules", lambda: rules[0])
+    monkeypatch.setattr(triage, "format_contacts_for_prompt", lambda: "")
+    monkeypatch.setattr(triage, "format_sender_context_for_prompt", lambda sender: "")
+    monkeypatch.setattr(triage, "is_high_priority", lambda sender: False)
+    monkeypatch.setattr(triage, "api_available", lambda: False)
+    monkeypatch.setattr(triage, "cli_available", lambda: True)
+    monkeypatch.setattr(triage, "run_claude", fake_claude)
+    items = [InboxItem("email", "me@x.com", "ann@x.com", "Hi", "lunch?", 1, True, "item-1")]
+
+    assert [p.reasoning for p in triage.iter_triage_items(items)] == ["r"]
+    assert [p.reasoning for p in triage.iter_triage_items(items)] == ["[cached] r"]
+    assert len(calls) == 1
+
+    rules[0] = "Flag everything from ann."
+    assert [p.reasoning for p in triage.iter_triage_items(items)] == ["r"]
+    assert len(calls) == 2
+
+
+def test_reject_forgets_only_that_triage_decision(initialized_db):
+    triage_cache.store_many(
+        [
+            ("sig-a", "archive", "newsletter", 0.9),
+            ("sig-b", "delete", "promo", 0.9),
+            ("sig-c", "archive", "receipt", 0.9),
+        ]
+    )
+    results = proposals.create_proposals_bulk(
+        [
+            {
+                "entity_type": "thread",
+                "entity_id": f"thread-{name}",
+                "proposed_action": "archive",
+                "triage_sig": f"sig-{name}",
+                "skip_validation": True,
+            }
+            for name in ("a", "b")
+        ]
+    )
+    (plain_id, _, _), (corrected_id, _, _) = results
+
+    assert proposals.reject_proposal(plain_id)
+    assert set(triage_cache.get_many(["sig-a", "sig-b", "sig-c"])) == {"sig-b", "sig-c"}
+
+    assert proposals.reject_proposal(corrected_id, correction="flag")
+    assert set(triage_cache.get_many(["sig-a", "sig-b", "sig-c"])) == {"sig-c"}
+
+
+def test_poll_phone_batches_agent_replies(monkeypatch):
+    incoming = [
+        {"from": "+111", "from_name": "Ann", "body": "status"},
+        {"from": "+222", "from_name": "Bob", "body": "status"},
+        {"from": "+111", "from_name": "Ann", "body": "help"},
+    ]
+    calls = []
+
+    def fake_send(phone, recipients, message, attachment=None):
+        calls.append((recipients, message))
+        return True, "Sent"
+
+    monkeypatch.setattr(signal_adapter, "receive", lambda phone, timeout, store: incoming)
+    monkeypatch.setattr(signal_adapter, "_send", fake_send)
+    monkeypatch.setattr(
+        daemon.agent, "handle_incoming", lambda phone, m, use_nlp: f"re {m['body']}"
+    )
+    monkeypatch.setattr(daemon, "_log", lambda msg: None)
+
+    assert daemon._poll_phone("+999", 1, agent_enabled=True, use_nlp=False) == 3
+    # Identical replies share a call; Ann's two replies stay separate and in order.
+    assert calls == [(["+111", "+222"], "re status"), (["+111"], "re help")]
+
+
+def test_match_noise_follows_pattern_order():
+    match = patterns.match_noise("Shop <promo@shop.com>", "Password reset", "noreply@shop.com")
+    assert match is not None
+    assert match.reason == "noreply sender"
+    assert patterns.match_noise("ann@example.com", "Lunch?", "See you") is None
+    assert patterns.detect_urgency("URGENT", "reply by friday") == (
+        0.9,
+        "marked urgent, has deadline",
+    )
+
+
+def test_contact_context_first_match_wins(tmp_path, monkeypatch):
+    contacts_path = tmp_path / "contacts.md"
+    contacts_path.write_text(
+        "## *Example.com\nwork\n\n## ann@example.com\nsister\n\n## Bob\nfriend\n"
+    )
+    monkeypatch.setattr(contacts, "CONTACTS_PATH", contacts_path)
+    monkeypatch.setattr(contacts, "PEEPS_DIR", tmp_path / "peeps")
+    monkeypatch.setattr(contacts, "_cache", None)
+
+    assert contacts.get_contact_context("ANN@example.com").notes == "work"
+    assert contacts.get_contact_context("Bob <bob@other.org>").notes == "friend"
+    assert contacts.get_contact_context("x@example.com.evil") is None
+    assert not contacts.is_high_priority("Bob <bob@other.org>")
+
+    peeps_dir = tmp_path / "peeps"
+    peeps_dir.mkdir()
+    (peeps_dir / "bob.md").write_text("- friend\n")
+    assert contacts.is_high_priority("Bob <bob@other.org>")
+
+
+def test_iter_json_objects_ignores_braces_in_escaped_strings():
+    chunks = ['[{"id":"a","reasoning":"said \\', '"}\\" then left"},', '{"id":"b"}]']
+
+    assert list(triage._iter_json_objects(chunks)) == [
+        {"id": "a", "reasoning": 'said "}" then left'},
+        {"id": "b"},
+    ]
+
+
+def test_iter_json_objects_reads_array_inside_wrapper():
+    chunks = ['{"proposals": [{"id": "a", "meta": {"x": 1}}', ', {"id": "b"}]}']
+
+    assert list(triage._iter_json_objects(chunks, nested=1)) == [
+        {"id": "a", "meta": {"x": 1}},
+        {"id": "b"},
+    ]
+
+
+def test_iter_json_objects_stops_at_truncation():
+    assert list(triage._iter_json_objects(['[{"id": "a"}, {"id": "b", "act'])) == [{"id": "a"}]
+
+
+def test_parse_response_salvages_around_malformed_object():
+    items = [
+        InboxItem("email", f"me@x.com:{n}", "ann@x.com", "Hi", "", 1, True, f"item-{n}")
+        for n in range(3)
+    ]
+    output = (
+        '```json\n[{"id": "item-0", "action": "archive", "confidence": 0.9},\n'
+        ' {"id": "item-1", "action": },\n'
+        ' {"id": "item-2", "action": "flag", "confidence": 0.8}]\n```'
+    )
+
+    parsed = triage._parse_response(output, items)
+
+    assert [(p.item.item_id, p.action) for p in parsed] == [
+        ("item-0", "archive"),
+        ("item-2", "flag"),
+    ]